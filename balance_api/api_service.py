@@ -1,14 +1,22 @@
-from fastapi import FastAPI, HTTPException
-from typing import List
-from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from sqlalchemy import update, select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from dotenv import load_dotenv
+from datetime import datetime
+from collections import defaultdict
+import asyncio
 import os
+import uuid
 import logging
 from models.BalanceOperationCreate import BalanceOperationCreate
 from models.BalanceOperation import BalanceOperation
+from models.ClientBalance import ClientBalance
 from models.TransactionCreate import TransactionCreate
+from events import BalanceEventBroker
 
 load_dotenv()
 
@@ -19,99 +27,527 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+MAX_BALANCE_LOOKUP_IDS = int(os.getenv("MAX_BALANCE_LOOKUP_IDS", 500))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+BALANCE_EVENTS_HISTORY = int(os.getenv("BALANCE_EVENTS_HISTORY", 1000))
+BALANCE_EVENTS_HEARTBEAT = float(os.getenv("BALANCE_EVENTS_HEARTBEAT", 15))
+
+def async_database_url(url: str) -> str:
+    """Point a plain postgresql:// URL at the asyncpg driver."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+engine = create_async_engine(
+    async_database_url(DATABASE_URL),
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True
+)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 app = FastAPI()
+balance_events = BalanceEventBroker(history_size=BALANCE_EVENTS_HISTORY)
+
+async def apply_balance_delta(db: AsyncSession, client_id: str, delta: int) -> int:
+    """Add delta to the client's materialized balance within the caller's transaction."""
+    stmt = pg_insert(ClientBalance).values(clientId=client_id, balance=delta, updatedAt=datetime.utcnow())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ClientBalance.clientId],
+        set_={
+            "balance": ClientBalance.balance + stmt.excluded.balance,
+            "updatedAt": stmt.excluded.updatedAt
+        }
+    ).returning(ClientBalance.balance)
+    return (await db.execute(stmt)).scalar()
+
+async def debit_if_sufficient(db: AsyncSession, client_id: str, amount: int) -> Optional[int]:
+    """Debit the client's materialized balance only if it covers amount; returns the new balance or None."""
+    stmt = update(ClientBalance).where(
+        ClientBalance.clientId == client_id,
+        ClientBalance.balance >= amount
+    ).values(
+        balance=ClientBalance.balance - amount,
+        updatedAt=datetime.utcnow()
+    ).returning(ClientBalance.balance)
+    return (await db.execute(stmt)).scalar()
+
+async def find_operation_by_key(db: AsyncSession, operation_key: Optional[str]) -> Optional[BalanceOperation]:
+    if not operation_key:
+        return None
+    result = await db.execute(select(BalanceOperation).where(BalanceOperation.operationKey == operation_key))
+    return result.scalar_one_or_none()
+
+async def commit_or_replay(db: AsyncSession, operation_key: Optional[str]) -> Optional[BalanceOperation]:
+    """Commit, or return the operation that won a concurrent insert with the same key."""
+    try:
+        await db.commit()
+        return None
+    except IntegrityError:
+        await db.rollback()
+        existing = await find_operation_by_key(db, operation_key)
+        if not existing:
+            raise
+        logger.info(f"Concurrent duplicate for operation key {operation_key}, replaying {existing.id}")
+        return existing
+
+def ensure_same_operation(existing: BalanceOperation, client_id: str, amount: int) -> None:
+    """A key may only replay the operation it was first used for; anything else is a caller bug."""
+    if str(existing.clientId).lower() != client_id.lower() or existing.amount != amount:
+        logger.warning(f"Operation key {existing.operationKey} reused for {client_id} ({amount}); "
+                       f"stored {existing.clientId} ({existing.amount})")
+        raise HTTPException(status_code=409, detail="Idempotency key already used for a different operation")
+
+async def get_balance(db: AsyncSession, client_id: str) -> int:
+    client_balance = await db.get(ClientBalance, client_id)
+    return client_balance.balance if client_balance else 0
 
 @app.post("/balance/add")
-def add_balance_operation(op: BalanceOperationCreate):
+async def add_balance_operation(op: BalanceOperationCreate, idempotency_key: Optional[str] = Header(None)):
     logger.info(f"Adding balance for client {op.clientId}: +{op.amount} ({op.description})")
-    db: Session = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
+        operation_key = idempotency_key or op.operationKey
+        existing = await find_operation_by_key(db, operation_key)
+        if existing:
+            ensure_same_operation(existing, op.clientId, abs(op.amount))
+            logger.info(f"Replaying balance operation {existing.id} for key {operation_key}")
+            return existing
+
         balance_op = BalanceOperation(
             clientId=op.clientId,
             amount=abs(op.amount),
-            description=op.description
+            description=op.description,
+            operationKey=operation_key
         )
         db.add(balance_op)
-        db.commit()
-        db.refresh(balance_op)
+        new_balance = await apply_balance_delta(db, op.clientId, balance_op.amount)
+        existing = await commit_or_replay(db, operation_key)
+        if existing:
+            ensure_same_operation(existing, op.clientId, balance_op.amount)
+            return existing
+        await db.refresh(balance_op)
+        balance_events.publish(op.clientId, new_balance, balance_op.amount)
         logger.info(f"Successfully added balance operation: {balance_op.id}")
         return balance_op
     finally:
-        db.close()
+        await db.close()
 
 @app.post("/balance/subtract")
-def subtract_balance_operation(op: BalanceOperationCreate):
+async def subtract_balance_operation(op: BalanceOperationCreate, idempotency_key: Optional[str] = Header(None)):
     logger.info(f"Subtracting balance for client {op.clientId}: -{abs(op.amount)} ({op.description})")
-    db: Session = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
+        op.operationKey = idempotency_key or op.operationKey
+        existing = await find_operation_by_key(db, op.operationKey)
+        if existing:
+            ensure_same_operation(existing, op.clientId, -abs(op.amount))
+            logger.info(f"Replaying balance operation {existing.id} for key {op.operationKey}")
+            return existing
+
         op.amount = -abs(op.amount)
         balance_op = BalanceOperation(**op.dict())
         db.add(balance_op)
-        db.commit()
-        db.refresh(balance_op)
+        new_balance = await apply_balance_delta(db, op.clientId, balance_op.amount)
+        existing = await commit_or_replay(db, op.operationKey)
+        if existing:
+            ensure_same_operation(existing, op.clientId, balance_op.amount)
+            return existing
+        await db.refresh(balance_op)
+        balance_events.publish(op.clientId, new_balance, balance_op.amount)
         logger.info(f"Successfully subtracted balance operation: {balance_op.id}")
         return balance_op
     finally:
-        db.close()
+        await db.close()
+
+@app.post("/balance/debit-if-sufficient")
+async def debit_balance_if_sufficient(op: BalanceOperationCreate, idempotency_key: Optional[str] = Header(None)):
+    logger.info(f"Conditionally debiting client {op.clientId}: -{abs(op.amount)} ({op.description})")
+    db: AsyncSession = SessionLocal()
+    try:
+        operation_key = idempotency_key or op.operationKey
+        existing = await find_operation_by_key(db, operation_key)
+        if existing is None:
+            amount = abs(op.amount)
+            new_balance = await debit_if_sufficient(db, op.clientId, amount)
+            if new_balance is None:
+                logger.warning(f"Debit refused - insufficient balance for client {op.clientId}")
+                raise HTTPException(status_code=400, detail="Insufficient balance")
+
+            balance_op = BalanceOperation(
+                clientId=op.clientId,
+                amount=-amount,
+                description=op.description,
+                operationKey=operation_key
+            )
+            db.add(balance_op)
+            existing = await commit_or_replay(db, operation_key)
+        if existing:
+            ensure_same_operation(existing, op.clientId, -abs(op.amount))
+            logger.info(f"Replaying balance operation {existing.id} for key {operation_key}")
+            balance_op = existing
+            new_balance = await get_balance(db, op.clientId)
+        else:
+            await db.refresh(balance_op)
+            balance_events.publish(op.clientId, new_balance, balance_op.amount)
+            logger.info(f"Successfully debited balance operation: {balance_op.id} (new balance: {new_balance})")
+        return {
+            "id": balance_op.id,
+            "clientId": balance_op.clientId,
+            "amount": balance_op.amount,
+            "description": balance_op.description,
+            "balance": new_balance
+        }
+    finally:
+        await db.close()
 
 @app.post("/balance/transaction")
-def create_transaction(transaction: TransactionCreate):
+async def create_transaction(transaction: TransactionCreate, idempotency_key: Optional[str] = Header(None)):
     logger.info(f"Creating transaction: {transaction.senderId} -> {transaction.receiverId}, amount: {transaction.amount}")
-    db: Session = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
         if transaction.senderId == transaction.receiverId:
             logger.warning(f"Transaction failed: sender and receiver are the same ({transaction.senderId})")
             raise HTTPException(status_code=400, detail="Sender and receiver cannot be the same")
 
+        operation_key = idempotency_key or transaction.operationKey
+        receiver_key = f"{operation_key}:receiver" if operation_key else None
+        existing = await find_operation_by_key(db, operation_key)
+        if existing:
+            ensure_same_operation(existing, transaction.senderId, -abs(transaction.amount))
+            logger.info(f"Replaying transaction {existing.id} for key {operation_key}")
+            return {
+                "sender": existing,
+                "receiver": await find_operation_by_key(db, receiver_key),
+                "senderBalance": await get_balance(db, transaction.senderId)
+            }
+
         sender_op = BalanceOperation(
             clientId=transaction.senderId,
             amount=-abs(transaction.amount),
-            description=f"Transaction to {transaction.receiverId}: {transaction.description}"
+            description=f"Transaction to {transaction.receiverId}: {transaction.description}",
+            operationKey=operation_key
         )
         receiver_op = BalanceOperation(
             clientId=transaction.receiverId,
             amount=abs(transaction.amount),
-            description=f"Transaction from {transaction.senderId}: {transaction.description}"
+            description=f"Transaction from {transaction.senderId}: {transaction.description}",
+            operationKey=receiver_key
         )
         db.add(sender_op)
         db.add(receiver_op)
-        db.commit()
-        db.refresh(sender_op)
-        db.refresh(receiver_op)
+        # Lock projection rows in a stable order so opposite transfers cannot deadlock
+        sender_balance = receiver_balance = None
+        for client_op in sorted([sender_op, receiver_op], key=lambda o: o.clientId):
+            if client_op is sender_op:
+                sender_balance = await debit_if_sufficient(db, sender_op.clientId, abs(sender_op.amount))
+                if sender_balance is None:
+                    logger.warning(f"Transaction failed: insufficient balance for sender {transaction.senderId}")
+                    raise HTTPException(status_code=400, detail="Insufficient balance")
+            else:
+                receiver_balance = await apply_balance_delta(db, client_op.clientId, client_op.amount)
+        existing = await commit_or_replay(db, operation_key)
+        if existing:
+            ensure_same_operation(existing, transaction.senderId, sender_op.amount)
+            return {
+                "sender": existing,
+                "receiver": await find_operation_by_key(db, receiver_key),
+                "senderBalance": await get_balance(db, transaction.senderId)
+            }
+        await db.refresh(sender_op)
+        await db.refresh(receiver_op)
+        balance_events.publish(sender_op.clientId, sender_balance, sender_op.amount)
+        balance_events.publish(receiver_op.clientId, receiver_balance, receiver_op.amount)
         
         logger.info(f"Successfully created transaction: {sender_op.id} and {receiver_op.id}")
-        return {"sender": sender_op, "receiver": receiver_op}
+        return {"sender": sender_op, "receiver": receiver_op, "senderBalance": sender_balance}
+
+    finally:
+        await db.close()
+
+@app.post("/balance/batch")
+async def create_batch_operations(ops: List[BalanceOperationCreate]):
+    logger.info(f"Creating batch of {len(ops)} balance operations")
+    if not ops:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one operation")
+
+    db: AsyncSession = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "clientId": op.clientId,
+                "amount": op.amount,
+                "description": op.description,
+                "operationKey": op.operationKey,
+                "createdAt": now,
+                "updatedAt": now
+            }
+            for op in ops
+        ]
+        # Lock the projection rows before writing the ledger, in the same table order as the
+        # single-operation endpoints and rebuild_balances.py, and in clientId order
+        await db.execute(
+            select(ClientBalance.clientId).where(
+                ClientBalance.clientId.in_({row["clientId"] for row in rows})
+            ).order_by(ClientBalance.clientId).with_for_update()
+        )
+        # Rows whose operationKey already exists are skipped and reported as duplicates
+        stmt = pg_insert(BalanceOperation).on_conflict_do_nothing(
+            index_elements=[BalanceOperation.operationKey]
+        ).returning(BalanceOperation.id)
+        inserted_ids = set((await db.execute(stmt, rows)).scalars().all())
+
+        deltas = defaultdict(int)
+        for row in rows:
+            if row["id"] in inserted_ids:
+                deltas[row["clientId"]] += row["amount"]
+        balances = {}
+        for client_id in sorted(deltas):
+            balances[client_id] = await apply_balance_delta(db, client_id, deltas[client_id])
 
+        duplicate_keys = [row["operationKey"] for row in rows if row["id"] not in inserted_ids]
+        existing_ids = {}
+        if duplicate_keys:
+            result = await db.execute(
+                select(
+                    BalanceOperation.operationKey,
+                    BalanceOperation.id,
+                    BalanceOperation.clientId,
+                    BalanceOperation.amount
+                ).where(
+                    BalanceOperation.operationKey.in_(duplicate_keys)
+                )
+            )
+            existing = {row.operationKey: row for row in result.all()}
+            conflicts = [
+                row["operationKey"] for row in rows
+                if row["id"] not in inserted_ids and row["operationKey"] in existing and (
+                    str(existing[row["operationKey"]].clientId).lower() != row["clientId"].lower()
+                    or existing[row["operationKey"]].amount != row["amount"]
+                )
+            ]
+            if conflicts:
+                await db.rollback()
+                logger.warning(f"Batch reused operation keys for different operations: {conflicts[:10]}")
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Idempotency keys already used for different operations: {', '.join(conflicts[:10])}"
+                )
+            existing_ids = {key: row.id for key, row in existing.items()}
+
+        await db.commit()
+        for client_id, balance in balances.items():
+            balance_events.publish(client_id, balance, deltas[client_id])
+
+        logger.info(f"Successfully created batch of {len(inserted_ids)} balance operations for {len(deltas)} clients "
+                    f"({len(duplicate_keys)} duplicates skipped)")
+        return {
+            "count": len(inserted_ids),
+            "duplicates": len(duplicate_keys),
+            "operations": [
+                {
+                    "id": row["id"] if row["id"] in inserted_ids else existing_ids.get(row["operationKey"]),
+                    "clientId": row["clientId"],
+                    "amount": row["amount"],
+                    "description": row["description"],
+                    "operationKey": row["operationKey"],
+                    "status": "created" if row["id"] in inserted_ids else "duplicate"
+                }
+                for row in rows
+            ]
+        }
+    finally:
+        await db.close()
+
+@app.get("/balance")
+async def get_balances(ids: str):
+    user_ids = list(dict.fromkeys(user_id.strip() for user_id in ids.split(",") if user_id.strip()))
+    logger.info(f"Getting balances for {len(user_ids)} users")
+    if not user_ids:
+        raise HTTPException(status_code=400, detail="At least one id is required")
+    if len(user_ids) > MAX_BALANCE_LOOKUP_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BALANCE_LOOKUP_IDS} ids per request")
+
+    db: AsyncSession = SessionLocal()
+    try:
+        result = await db.execute(
+            select(ClientBalance.clientId, ClientBalance.balance).where(
+                ClientBalance.clientId.in_(user_ids)
+            )
+        )
+        rows = result.all()
+        balances = {user_id: 0 for user_id in user_ids}
+        balances.update({row.clientId: row.balance for row in rows})
+        return {"balances": balances}
+    finally:
+        await db.close()
+
+@app.get("/balance/events")
+async def stream_balance_events(request: Request, ids: Optional[str] = None, last_event_id: Optional[str] = Header(None)):
+    """Server-sent events for every balance change, resumable through Last-Event-ID."""
+    client_ids = {user_id.strip() for user_id in ids.split(",") if user_id.strip()} if ids else None
+    logger.info(f"Balance event stream opened (resume from: {last_event_id}, filter: {len(client_ids) if client_ids else 'all'})")
+
+    async def event_stream():
+        subscriber = balance_events.subscribe()
+        try:
+            backlog = balance_events.replay(last_event_id)
+            if backlog is None:
+                yield balance_events.format_reset()
+                backlog = []
+            last_seq = backlog[-1]["seq"] if backlog else balance_events.seq
+            for event in backlog:
+                if client_ids is None or event["clientId"] in client_ids:
+                    yield balance_events.format_event(event)
+
+            while not await request.is_disconnected():
+                if subscriber.overflowed and subscriber.queue.empty():
+                    yield balance_events.format_reset()
+                    return
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), timeout=BALANCE_EVENTS_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event["seq"] <= last_seq:
+                    continue
+                last_seq = event["seq"]
+                if client_ids is None or event["clientId"] in client_ids:
+                    yield balance_events.format_event(event)
+        finally:
+            balance_events.unsubscribe(subscriber)
+            logger.info("Balance event stream closed")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/balance/leaderboard")
+async def get_leaderboard(limit: int = 10):
+    limit = max(1, min(limit, 100))
+    logger.info(f"Getting balance leaderboard (limit: {limit})")
+    db: AsyncSession = SessionLocal()
+    try:
+        result = await db.execute(
+            select(
+                ClientBalance.clientId,
+                ClientBalance.balance,
+                # RANK() so tied balances share a rank, matching /balance/rank
+                func.rank().over(order_by=ClientBalance.balance.desc()).label("rank")
+            ).order_by(
+                ClientBalance.balance.desc(), ClientBalance.clientId
+            ).limit(limit)
+        )
+        rows = result.all()
+        return {
+            "leaderboard": [
+                {
+                    "rank": row.rank,
+                    "user_id": row.clientId,
+                    "balance": row.balance
+                }
+                for row in rows
+            ]
+        }
+    finally:
+        await db.close()
+
+@app.get("/balance/rank/{user_id}")
+async def get_user_rank(user_id: str):
+    logger.info(f"Getting balance rank for user: {user_id}")
+    db: AsyncSession = SessionLocal()
+    try:
+        client_balance = await db.get(ClientBalance, user_id)
+        if not client_balance:
+            raise HTTPException(status_code=404, detail="User has no balance")
+        ahead = await db.scalar(
+            select(func.count(ClientBalance.clientId)).where(
+                ClientBalance.balance > client_balance.balance
+            )
+        )
+        total = await db.scalar(select(func.count(ClientBalance.clientId)))
+        return {
+            "user_id": user_id,
+            "balance": client_balance.balance,
+            "rank": ahead + 1,
+            "totalClients": total
+        }
     finally:
-        db.close()
+        await db.close()
 
 @app.get("/balance/{user_id}")
-def get_user_balance(user_id: str):
+async def get_user_balance(user_id: str):
     logger.info(f"Getting balance for user: {user_id}")
-    db: Session = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
-        ops = db.query(BalanceOperation).filter(BalanceOperation.clientId == user_id).with_entities(BalanceOperation.amount)
-        balance = sum([op.amount for op in ops])
+        client_balance = await db.get(ClientBalance, user_id)
+        balance = client_balance.balance if client_balance else 0
         logger.info(f"User {user_id} balance: {balance}")
         return {"user_id": user_id, "balance": balance}
     finally:
-        db.close()
+        await db.close()
+
+def encode_operations_cursor(op) -> str:
+    return f"{op.createdAt.isoformat()}|{op.id}"
+
+def decode_operations_cursor(cursor: str):
+    try:
+        created_at, op_id = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at), op_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 @app.get("/balance/operations/{user_id}")
-def get_user_operations(user_id: str):
-    logger.info(f"Getting operations for user: {user_id}")
-    db: Session = SessionLocal()
+async def get_user_operations(user_id: str, limit: int = 50, before: Optional[str] = None):
+    limit = max(1, min(limit, 100))
+    logger.info(f"Getting operations for user: {user_id} (limit: {limit}, before: {before})")
+    db: AsyncSession = SessionLocal()
     try:
-        ops = db.query(BalanceOperation).filter(BalanceOperation.clientId == user_id).all()
+        query = select(
+            BalanceOperation.id,
+            BalanceOperation.amount,
+            BalanceOperation.description,
+            BalanceOperation.createdAt
+        ).where(BalanceOperation.clientId == user_id)
+        if before:
+            query = query.where(
+                tuple_(BalanceOperation.createdAt, BalanceOperation.id) < tuple_(*decode_operations_cursor(before))
+            )
+        result = await db.execute(
+            query.order_by(
+                BalanceOperation.createdAt.desc(), BalanceOperation.id.desc()
+            ).limit(limit + 1)
+        )
+        ops = result.all()
+
+        has_more = len(ops) > limit
+        ops = ops[:limit]
         logger.info(f"Retrieved {len(ops)} operations for user {user_id}")
-        return ops
+        return {
+            "operations": [
+                {
+                    "id": op.id,
+                    "amount": op.amount,
+                    "description": op.description,
+                    "createdAt": op.createdAt
+                }
+                for op in ops
+            ],
+            "nextCursor": encode_operations_cursor(ops[-1]) if has_more else None
+        }
     finally:
-        db.close()
+        await db.close()
 
 @app.get("/health")
-def health_check():
+async def health_check():
     logger.info("Health check requested")
     return {"status": "healthy", "service": "balance-api"}
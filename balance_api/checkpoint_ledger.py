@@ -0,0 +1,259 @@
+"""Fold old balance_operation rows into one checkpoint row per client and archive them.
+
+Rows older than the horizon are streamed oldest-first in chunks, appended to gzip
+JSONL files under LEDGER_ARCHIVE_DIR (one file per month of createdAt), deleted,
+and their net amount is added to the client's checkpoint row. Each chunk is
+committed on its own, so a client's ledger sum never changes and memory stays
+bounded by the chunk size.
+
+Rows carrying an operationKey are never archived: their unique index entry is
+what makes a replayed key a no-op, so they stay in the ledger for good.
+Restored rows are older than the horizon, so the next checkpoint pass (including
+an --every loop) archives them again; stop the loop while inspecting them.
+
+Usage:
+    python checkpoint_ledger.py checkpoint [--days 180] [--chunk-size 5000] [--every 24]
+    python checkpoint_ledger.py restore 2025-01 [--chunk-size 5000]
+"""
+from sqlalchemy import create_engine, select, update, delete, exists
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from collections import defaultdict
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+import argparse
+import gzip
+import json
+import os
+import time
+import uuid
+import logging
+from models.BalanceOperation import BalanceOperation
+from models.LedgerCheckpoint import LedgerCheckpoint
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+LEDGER_CHECKPOINT_DAYS = int(os.getenv("LEDGER_CHECKPOINT_DAYS", 180))
+LEDGER_ARCHIVE_DIR = os.getenv("LEDGER_ARCHIVE_DIR", "ledger_archive")
+
+def archive_path(month: str) -> str:
+    return os.path.join(LEDGER_ARCHIVE_DIR, f"balance_operation-{month}.jsonl.gz")
+
+def checkpoint_description(cutoff: datetime) -> str:
+    return f"Ledger checkpoint through {cutoff.date().isoformat()}"
+
+def serialize_operation(op: BalanceOperation) -> dict:
+    return {
+        "id": op.id,
+        "clientId": op.clientId,
+        "amount": op.amount,
+        "description": op.description,
+        "operationKey": op.operationKey,
+        "createdAt": op.createdAt.isoformat(),
+        "updatedAt": op.updatedAt.isoformat()
+    }
+
+def append_to_archive(ops) -> None:
+    """Append operations to their month's archive; gzip members concatenate cleanly."""
+    by_month = defaultdict(list)
+    for op in ops:
+        by_month[op.createdAt.strftime("%Y-%m")].append(op)
+    os.makedirs(LEDGER_ARCHIVE_DIR, exist_ok=True)
+    for month, month_ops in by_month.items():
+        with gzip.open(archive_path(month), "at", encoding="utf-8") as archive:
+            for op in month_ops:
+                archive.write(json.dumps(serialize_operation(op)) + "\n")
+
+def fold_into_checkpoint(db: Session, client_id: str, delta: int, rows: int, cutoff: datetime) -> None:
+    """Add delta to the client's checkpoint row, creating it on first use."""
+    checkpoint = db.get(LedgerCheckpoint, client_id, with_for_update=True)
+    if checkpoint:
+        cutoff = max(checkpoint.cutoff, cutoff)
+        db.execute(
+            update(BalanceOperation).where(
+                BalanceOperation.id == checkpoint.balanceOperationId
+            ).values(
+                amount=BalanceOperation.amount + delta,
+                description=checkpoint_description(cutoff),
+                createdAt=cutoff,
+                updatedAt=datetime.utcnow()
+            )
+        )
+        checkpoint.amount += delta
+        checkpoint.archivedRows += rows
+        checkpoint.cutoff = cutoff
+        return
+
+    checkpoint_op = BalanceOperation(
+        clientId=client_id,
+        amount=delta,
+        description=checkpoint_description(cutoff)
+    )
+    checkpoint_op.id = str(uuid.uuid4())
+    checkpoint_op.createdAt = cutoff
+    db.add(checkpoint_op)
+    db.add(LedgerCheckpoint(
+        clientId=client_id,
+        balanceOperationId=checkpoint_op.id,
+        amount=delta,
+        archivedRows=rows,
+        cutoff=cutoff
+    ))
+
+def checkpoint_ledger(session_factory, cutoff: datetime, chunk_size: int) -> int:
+    """Archive and fold every unkeyed, non-checkpoint operation created before cutoff."""
+    archived = 0
+    while True:
+        db: Session = session_factory()
+        try:
+            ops = db.query(BalanceOperation).filter(
+                BalanceOperation.createdAt < cutoff,
+                BalanceOperation.operationKey.is_(None),
+                ~exists().where(LedgerCheckpoint.balanceOperationId == BalanceOperation.id)
+            ).order_by(
+                BalanceOperation.createdAt, BalanceOperation.id
+            ).limit(chunk_size).all()
+            if not ops:
+                return archived
+
+            # Archive first: a crash before commit only leaves duplicates, which restore skips
+            append_to_archive(ops)
+
+            deltas = defaultdict(int)
+            counts = defaultdict(int)
+            for op in ops:
+                deltas[op.clientId] += op.amount
+                counts[op.clientId] += 1
+            db.execute(delete(BalanceOperation).where(BalanceOperation.id.in_([op.id for op in ops])))
+            for client_id in sorted(deltas):
+                fold_into_checkpoint(db, client_id, deltas[client_id], counts[client_id], cutoff)
+            db.commit()
+
+            archived += len(ops)
+            logger.info(f"Checkpointed {len(ops)} operations for {len(deltas)} clients ({archived} so far)")
+        finally:
+            db.close()
+
+def restore_chunk(db: Session, rows: list) -> int:
+    """Re-insert archived rows and take their amounts back out of the checkpoints.
+
+    Archives written before keyed rows were kept out of checkpoints may hold a
+    key that was replayed and applied again after archiving. That row is restored
+    without its key (both credits really happened) and logged for follow-up.
+    """
+    keys = [row["operationKey"] for row in rows if row.get("operationKey")]
+    taken = {}
+    if keys:
+        taken = dict(db.execute(
+            select(BalanceOperation.operationKey, BalanceOperation.id).where(
+                BalanceOperation.operationKey.in_(keys)
+            )
+        ).all())
+    values = []
+    for row in rows:
+        key = row.get("operationKey")
+        if key in taken and taken[key] != row["id"]:
+            logger.warning(f"Operation key {key} was reapplied as {taken[key]} after archiving {row['id']}; "
+                           f"restoring {row['id']} without its key")
+            key = None
+        values.append({
+            **row,
+            "operationKey": key,
+            "createdAt": datetime.fromisoformat(row["createdAt"]),
+            "updatedAt": datetime.fromisoformat(row["updatedAt"])
+        })
+    stmt = pg_insert(BalanceOperation).values(values).on_conflict_do_nothing(
+        index_elements=[BalanceOperation.id]
+    ).returning(BalanceOperation.clientId, BalanceOperation.amount)
+    inserted = db.execute(stmt).all()
+
+    deltas = defaultdict(int)
+    counts = defaultdict(int)
+    for row in inserted:
+        deltas[row.clientId] += row.amount
+        counts[row.clientId] += 1
+    for client_id in sorted(deltas):
+        checkpoint = db.get(LedgerCheckpoint, client_id, with_for_update=True)
+        if not checkpoint:
+            raise RuntimeError(f"No ledger checkpoint for client {client_id}; refusing to restore")
+        checkpoint.amount -= deltas[client_id]
+        checkpoint.archivedRows -= counts[client_id]
+        if checkpoint.archivedRows <= 0 and checkpoint.amount == 0:
+            db.execute(delete(BalanceOperation).where(BalanceOperation.id == checkpoint.balanceOperationId))
+            db.delete(checkpoint)
+        else:
+            db.execute(
+                update(BalanceOperation).where(
+                    BalanceOperation.id == checkpoint.balanceOperationId
+                ).values(
+                    amount=BalanceOperation.amount - deltas[client_id],
+                    updatedAt=datetime.utcnow()
+                )
+            )
+    return len(inserted)
+
+def restore_rows(session_factory, rows: list) -> int:
+    db: Session = session_factory()
+    try:
+        restored = restore_chunk(db, rows)
+        db.commit()
+        logger.info(f"Restored {restored} of {len(rows)} archived operations")
+        return restored
+    finally:
+        db.close()
+
+def restore_month(session_factory, month: str, chunk_size: int) -> int:
+    """Put one month's archived operations back into the ledger."""
+    path = archive_path(month)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No archive for {month} at {path}")
+
+    restored = 0
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        rows = []
+        for line in archive:
+            rows.append(json.loads(line))
+            if len(rows) >= chunk_size:
+                restored += restore_rows(session_factory, rows)
+                rows = []
+        if rows:
+            restored += restore_rows(session_factory, rows)
+
+    os.replace(path, f"{path}.restored")
+    return restored
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checkpoint and archive old ledger rows")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    checkpoint_parser = subcommands.add_parser("checkpoint", help="Fold operations older than the horizon")
+    checkpoint_parser.add_argument("--days", type=int, default=LEDGER_CHECKPOINT_DAYS)
+    checkpoint_parser.add_argument("--chunk-size", type=int, default=5000)
+    checkpoint_parser.add_argument("--every", type=float, default=None,
+                                   help="Keep running, checkpointing every N hours")
+    restore_parser = subcommands.add_parser("restore", help="Restore one archived month (YYYY-MM)")
+    restore_parser.add_argument("month")
+    restore_parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=create_engine(DATABASE_URL))
+
+    if args.command == "restore":
+        logger.info(f"Restoring archived operations for {args.month}")
+        restored = restore_month(SessionLocal, args.month, args.chunk_size)
+        logger.info(f"Restored {restored} operations for {args.month}")
+    else:
+        while True:
+            cutoff = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=args.days)
+            logger.info(f"Checkpointing operations created before {cutoff.isoformat()}")
+            archived = checkpoint_ledger(SessionLocal, cutoff, args.chunk_size)
+            logger.info(f"Checkpoint complete: archived {archived} operations to {LEDGER_ARCHIVE_DIR}")
+            if not args.every:
+                break
+            time.sleep(args.every * 3600)
@@ -0,0 +1,76 @@
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+import asyncio
+import json
+import uuid
+
+class BalanceEventSubscriber:
+    def __init__(self, queue_size: int):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+class BalanceEventBroker:
+    """In-process fan-out of balance changes with a replay buffer for resuming streams.
+
+    Event ids are "<epoch>:<seq>". The epoch changes on every process start, so a
+    consumer resuming with an id from another epoch, or one older than the replay
+    buffer, gets a reset event and must drop its cached balances.
+    """
+
+    def __init__(self, history_size: int = 1000, queue_size: int = 1000):
+        self.epoch = uuid.uuid4().hex[:12]
+        self.seq = 0
+        self.history = deque(maxlen=history_size)
+        self.queue_size = queue_size
+        self.subscribers = set()
+
+    def publish(self, client_id: str, balance: int, delta: int) -> dict:
+        self.seq += 1
+        event = {
+            "seq": self.seq,
+            "clientId": client_id,
+            "balance": balance,
+            "delta": delta,
+            "at": datetime.utcnow().isoformat()
+        }
+        self.history.append(event)
+        for subscriber in list(self.subscribers):
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Too slow to keep up: stop feeding it and let the stream send a reset
+                subscriber.overflowed = True
+                self.subscribers.discard(subscriber)
+        return event
+
+    def subscribe(self) -> BalanceEventSubscriber:
+        subscriber = BalanceEventSubscriber(self.queue_size)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: BalanceEventSubscriber) -> None:
+        self.subscribers.discard(subscriber)
+
+    def replay(self, last_event_id: Optional[str]) -> Optional[List[dict]]:
+        """Events after last_event_id, or None if the gap cannot be filled."""
+        if not last_event_id:
+            return []
+        epoch, _, seq = last_event_id.partition(":")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        seq = int(seq)
+        oldest = self.history[0]["seq"] if self.history else self.seq + 1
+        if seq < oldest - 1:
+            return None
+        return [event for event in self.history if event["seq"] > seq]
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}:{seq}"
+
+    def format_event(self, event: dict) -> str:
+        return f"id: {self.event_id(event['seq'])}\nevent: balance\ndata: {json.dumps(event)}\n\n"
+
+    def format_reset(self) -> str:
+        payload = json.dumps({"epoch": self.epoch, "seq": self.seq})
+        return f"id: {self.event_id(self.seq)}\nevent: reset\ndata: {payload}\n\n"
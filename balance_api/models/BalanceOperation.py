@@ -1,5 +1,6 @@
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
 
@@ -7,17 +8,19 @@ Base = declarative_base()
 
 class BalanceOperation(Base):
     __tablename__ = "balance_operation"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    clientId = Column(String, nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    clientId = Column(UUID(as_uuid=False), nullable=False)
     amount = Column(Integer, nullable=False)
     description = Column(String, nullable=False)
+    operationKey = Column(String, unique=True, nullable=True)
     createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
     updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
-    def __init__(self, clientId: str, amount: int, description: str):
+    def __init__(self, clientId: str, amount: int, description: str, operationKey: str = None):
         self.clientId = clientId
         self.amount = amount
         self.description = description
+        self.operationKey = operationKey
 
     def __repr__(self):
         return (f"BalanceOperation(id={self.id}, clientId={self.clientId}, "
@@ -0,0 +1,20 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+Base = declarative_base()
+
+class LedgerCheckpoint(Base):
+    """Tracks the balance_operation row that stands in for a client's archived history."""
+    __tablename__ = "ledger_checkpoint"
+    clientId = Column(UUID(as_uuid=False), primary_key=True)
+    balanceOperationId = Column(UUID(as_uuid=False), unique=True, nullable=False)
+    amount = Column(Integer, default=0, nullable=False)
+    archivedRows = Column(Integer, default=0, nullable=False)
+    cutoff = Column(DateTime, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return (f"LedgerCheckpoint(clientId={self.clientId}, balanceOperationId={self.balanceOperationId}, "
+                f"amount={self.amount}, archivedRows={self.archivedRows}, cutoff={self.cutoff})")
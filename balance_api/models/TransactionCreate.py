@@ -1,7 +1,9 @@
 from pydantic import BaseModel
+from typing import Optional
 
 class TransactionCreate(BaseModel):
     senderId: str
     receiverId: str
-    amount: float
+    amount: int
     description: str
+    operationKey: Optional[str] = None
@@ -0,0 +1,38 @@
+"""Recompute the client_balance projection from the balance_operation ledger.
+
+Usage:
+    python rebuild_balances.py
+"""
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+import os
+import logging
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+def rebuild_client_balances(engine) -> int:
+    """Replace every client_balance row with the sum of that client's ledger entries."""
+    with engine.begin() as conn:
+        # Block ledger writers while rebuilding so the projection matches the ledger exactly.
+        # Writers touch client_balance before balance_operation, so lock in that order too.
+        conn.execute(text('LOCK TABLE "client_balance" IN EXCLUSIVE MODE'))
+        conn.execute(text('LOCK TABLE "balance_operation" IN SHARE MODE'))
+        conn.execute(text('DELETE FROM "client_balance"'))
+        result = conn.execute(text(
+            'INSERT INTO "client_balance" ("clientId", "balance", "updatedAt") '
+            'SELECT "clientId", SUM("amount"), now() FROM "balance_operation" GROUP BY "clientId"'
+        ))
+        return result.rowcount
+
+if __name__ == "__main__":
+    logger.info("Rebuilding client_balance from balance_operation")
+    rebuilt = rebuild_client_balances(create_engine(DATABASE_URL))
+    logger.info(f"Rebuilt balances for {rebuilt} clients")
@@ -0,0 +1,107 @@
+"""Throughput benchmark for balance_api under concurrent clients.
+
+Runs a mixed read/write workload (GET /balance/{id}, POST /balance/add and
+POST /balance/debit-if-sufficient) against one or more running balance_api
+targets and prints requests per second and latency percentiles for each
+concurrency level, so two builds can be compared side by side.
+
+Usage:
+    python balance_concurrency.py --target async=http://localhost:5011
+    python balance_concurrency.py --target sync=http://localhost:5021 --target async=http://localhost:5011 --clients 50 200
+
+Only point this at a local stack: it writes ledger rows for throwaway client IDs.
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+import aiohttp
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def seed_clients(session, url, count):
+    client_ids = [str(uuid.uuid4()) for _ in range(count)]
+    operations = [
+        {"clientId": client_id, "amount": 1_000_000, "description": "Benchmark seed"}
+        for client_id in client_ids
+    ]
+    async with session.post(f"{url}/balance/batch", json=operations) as response:
+        if response.status != 200:
+            raise RuntimeError(f"Failed to seed clients on {url}: HTTP {response.status}")
+    return client_ids
+
+
+async def one_request(session, url, client_ids):
+    client_id = random.choice(client_ids)
+    roll = random.random()
+    if roll < 0.6:
+        return await session.get(f"{url}/balance/{client_id}")
+    payload = {"clientId": client_id, "amount": 1, "description": "Benchmark"}
+    if roll < 0.8:
+        return await session.post(f"{url}/balance/add", json=payload)
+    return await session.post(f"{url}/balance/debit-if-sufficient", json=payload)
+
+
+async def worker(session, url, client_ids, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await one_request(session, url, client_ids)
+            await response.read()
+            if response.status != 200:
+                errors.append(response.status)
+        except aiohttp.ClientError as e:
+            errors.append(str(e))
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_level(url, clients, duration, client_ids):
+    latencies, errors = [], []
+    connector = aiohttp.TCPConnector(limit=clients)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*[
+            worker(session, url, client_ids, deadline, latencies, errors)
+            for _ in range(clients)
+        ])
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / duration,
+        "p50": percentile(latencies, 50) * 1000,
+        "p95": percentile(latencies, 95) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+        "errors": len(errors)
+    }
+
+
+async def main(args):
+    targets = [target.split("=", 1) for target in args.target]
+    print(f"{'target':<12}{'clients':>8}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, url in targets:
+        url = url.rstrip("/")
+        async with aiohttp.ClientSession() as session:
+            client_ids = await seed_clients(session, url, args.accounts)
+        for clients in args.clients:
+            result = await run_level(url, clients, args.duration, client_ids)
+            print(f"{name:<12}{clients:>8}{result['requests']:>10}{result['rps']:>10.1f}"
+                  f"{result['p50']:>10.1f}{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", required=True,
+                        help="name=url of a running balance_api; repeat to compare builds")
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 200],
+                        help="concurrency levels to run (default: 50 200)")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per concurrency level")
+    parser.add_argument("--accounts", type=int, default=500, help="number of client IDs to spread load over")
+    asyncio.run(main(parser.parse_args()))
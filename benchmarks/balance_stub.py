@@ -0,0 +1,76 @@
+"""In-memory stand-in for balance_api, for benchmarks that should not measure it.
+
+Answers the calls bet_api makes - POST /balance/debit-if-sufficient (replaying
+on a repeated Idempotency-Key) and POST /balance/batch - plus GET /health,
+keeping balances in a dict. --latency-ms adds a fixed delay to every balance
+call to stand in for the real service's round trip.
+
+Usage:
+    python balance_stub.py --port 5999
+    python balance_stub.py --port 5999 --latency-ms 3
+"""
+import argparse
+import asyncio
+import uuid
+from collections import defaultdict
+from aiohttp import web
+
+
+def create_app(latency_ms):
+    balances = defaultdict(int)
+    operations = {}
+
+    async def delay():
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+
+    async def health(request):
+        return web.json_response({"status": "healthy", "service": "balance-stub"})
+
+    async def debit_if_sufficient(request):
+        op = await request.json()
+        await delay()
+        operation_key = request.headers.get("Idempotency-Key") or op.get("operationKey")
+        existing = operations.get(operation_key) if operation_key else None
+        if existing is None:
+            amount = abs(op["amount"])
+            if balances[op["clientId"]] < amount:
+                return web.json_response({"detail": "Insufficient balance"}, status=400)
+            balances[op["clientId"]] -= amount
+            existing = {
+                "id": str(uuid.uuid4()),
+                "clientId": op["clientId"],
+                "amount": -amount,
+                "description": op["description"]
+            }
+            if operation_key:
+                operations[operation_key] = existing
+        return web.json_response({**existing, "balance": balances[op["clientId"]]})
+
+    async def batch(request):
+        ops = await request.json()
+        await delay()
+        count = 0
+        for op in ops:
+            if op.get("operationKey") and op["operationKey"] in operations:
+                continue
+            balances[op["clientId"]] += op["amount"]
+            if op.get("operationKey"):
+                operations[op["operationKey"]] = {"id": str(uuid.uuid4()), **op}
+            count += 1
+        return web.json_response({"count": count, "duplicates": len(ops) - count})
+
+    app = web.Application()
+    app.router.add_get("/health", health)
+    app.router.add_post("/balance/debit-if-sufficient", debit_if_sufficient)
+    app.router.add_post("/balance/batch", batch)
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5999)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every balance call")
+    args = parser.parse_args()
+    web.run_app(create_app(args.latency_ms), host=args.host, port=args.port, print=None)
@@ -1,17 +1,30 @@
-from fastapi import FastAPI, HTTPException
-from typing import List
-from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import FastAPI, HTTPException, Header, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from typing import Dict, List, Optional
+from sqlalchemy import select, insert, update, func, tuple_, and_
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.exc import IntegrityError
 from dotenv import load_dotenv
 import os
-import requests
+import json
+import asyncio
 import logging
-from models.BetEvent import BetEvent, Base
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from models.BetEvent import BetEvent
 from models.BetEventCreate import BetEventCreate
+from models.BetEventOption import BetEventOption
 from models.UserBet import UserBet
 from models.UserBetCreate import UserBetCreate
 from models.BetFinalize import BetFinalize
+from models.SettlementJob import SettlementJob
+from models.SettlementPayout import SettlementPayout
+from service_client import ServiceClient, ServiceUnavailable
+from event_cache import ResponseCache, etag_matches
+from odds import OddsFeed, odds_snapshot
+from payouts import split_pool
+from settlement import SettlementWorker
 
 load_dotenv()
 
@@ -24,178 +37,302 @@ logger = logging.getLogger(__name__)
 DATABASE_URL = os.getenv("DATABASE_URL")
 BALANCE_API_URL = os.getenv("BALANCE_API_URL")
 CLIENT_API_URL = os.getenv("CLIENT_API_URL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+BALANCE_API_TIMEOUT = float(os.getenv("BALANCE_API_TIMEOUT", 5))
+BALANCE_API_RETRIES = int(os.getenv("BALANCE_API_RETRIES", 3))
+BALANCE_API_MAX_CONNECTIONS = int(os.getenv("BALANCE_API_MAX_CONNECTIONS", 50))
+BALANCE_API_MAX_CONCURRENCY = int(os.getenv("BALANCE_API_MAX_CONCURRENCY", 50))
+SETTLEMENT_CHUNK_SIZE = int(os.getenv("SETTLEMENT_CHUNK_SIZE", 100))
+SETTLEMENT_MAX_ATTEMPTS = int(os.getenv("SETTLEMENT_MAX_ATTEMPTS", 5))
+SETTLEMENT_RETRY_BACKOFF = float(os.getenv("SETTLEMENT_RETRY_BACKOFF", 5))
+SETTLEMENT_POLL_INTERVAL = float(os.getenv("SETTLEMENT_POLL_INTERVAL", 2))
+ACTIVE_EVENTS_CACHE_TTL = float(os.getenv("ACTIVE_EVENTS_CACHE_TTL", 30))
+ODDS_COALESCE_MS = int(os.getenv("ODDS_COALESCE_MS", 500))
+ODDS_HEARTBEAT = float(os.getenv("ODDS_HEARTBEAT", 15))
+MAX_EVENT_OPTIONS = int(os.getenv("MAX_EVENT_OPTIONS", 10))
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def async_database_url(url: str) -> str:
+    """Point a plain postgresql:// URL at the asyncpg driver."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
 
-Base.metadata.create_all(bind=engine)
+engine = create_async_engine(
+    async_database_url(DATABASE_URL),
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True
+)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+balance_api = ServiceClient(
+    "balance-api",
+    BALANCE_API_URL,
+    timeout=BALANCE_API_TIMEOUT,
+    max_connections=BALANCE_API_MAX_CONNECTIONS,
+    max_concurrency=BALANCE_API_MAX_CONCURRENCY,
+    retries=BALANCE_API_RETRIES
+)
 
 app = FastAPI()
+active_events_cache = ResponseCache(ttl=ACTIVE_EVENTS_CACHE_TTL)
+odds_feed = OddsFeed(coalesce_ms=ODDS_COALESCE_MS)
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "bet-api"}
 
-def get_db():
-    db = SessionLocal()
+async def debit_user_balance(user_id: str, amount: int, description: str, operation_key: str) -> Optional[int]:
+    """Debit user balance only if it covers amount; returns the balance API status code"""
+    payload = {
+        "clientId": user_id,
+        "amount": amount,
+        "description": description
+    }
     try:
-        yield db
-    finally:
-        db.close()
+        response = await balance_api.post("/balance/debit-if-sufficient", payload, idempotency_key=operation_key)
+    except ServiceUnavailable as e:
+        logger.error(f"Error debiting user balance for {user_id}: {e}")
+        return None
+    return response.status_code
 
-def check_user_balance(user_id: str, amount: int) -> bool:
-    """Check if user has sufficient balance"""
+async def add_user_balances(operations: List[dict]) -> bool:
+    """Credit several users in a single ledger batch; each operation carries its own operationKey"""
     try:
-        response = requests.get(f"{BALANCE_API_URL}/balance/{user_id}")
-        if response.status_code != 200:
-            return False
-        balance_data = response.json()
-        return balance_data.get("balance", 0) >= amount
-    except Exception as e:
-        logger.error(f"Error checking user balance: {e}")
+        response = await balance_api.post("/balance/batch", operations, retry=True)
+    except ServiceUnavailable as e:
+        logger.error(f"Error adding user balances for {len(operations)} operations: {e}")
         return False
+    return response.status_code == 200
 
-def subtract_user_balance(user_id: str, amount: int, description: str) -> bool:
-    """Subtract amount from user balance"""
-    try:
-        payload = {
-            "clientId": user_id,
-            "amount": amount,
-            "description": description
-        }
-        response = requests.post(f"{BALANCE_API_URL}/balance/subtract", json=payload)
-        return response.status_code == 200
-    except Exception as e:
-        logger.error(f"Error subtracting user balance: {e}")
-        return False
+settlement_worker = SettlementWorker(
+    SessionLocal,
+    add_user_balances,
+    chunk_size=SETTLEMENT_CHUNK_SIZE,
+    max_attempts=SETTLEMENT_MAX_ATTEMPTS,
+    retry_backoff=SETTLEMENT_RETRY_BACKOFF,
+    poll_interval=SETTLEMENT_POLL_INTERVAL
+)
 
-def add_user_balance(user_id: str, amount: int, description: str) -> bool:
-    """Add amount to user balance"""
-    try:
-        payload = {
-            "clientId": user_id,
-            "amount": amount,
-            "description": description
-        }
-        response = requests.post(f"{BALANCE_API_URL}/balance/add", json=payload)
-        return response.status_code == 200
-    except Exception as e:
-        logger.error(f"Error adding user balance: {e}")
-        return False
+@app.on_event("startup")
+async def startup():
+    await balance_api.start()
+    settlement_worker.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await settlement_worker.stop()
+    await balance_api.close()
 
 @app.post("/bet/event")
-def create_bet_event(event: BetEventCreate):
+async def create_bet_event(event: BetEventCreate):
     """Create a new betting event"""
-    db = SessionLocal()
+    labels = [label.strip() for label in event.options]
+    if not 2 <= len(labels) <= MAX_EVENT_OPTIONS:
+        raise HTTPException(status_code=400, detail=f"An event needs between 2 and {MAX_EVENT_OPTIONS} options")
+    if not all(labels):
+        raise HTTPException(status_code=400, detail="Option labels cannot be empty")
+    if len({label.lower() for label in labels}) != len(labels):
+        raise HTTPException(status_code=400, detail="Option labels must be unique")
+    
+    db: AsyncSession = SessionLocal()
     try:
         db_event = BetEvent(
             title=event.title,
-            description=event.description,
-            option1=event.option1,
-            option2=event.option2
+            description=event.description
         )
         db.add(db_event)
-        db.commit()
-        db.refresh(db_event)
+        await db.flush()
+        db.add_all([
+            BetEventOption(betEventId=db_event.id, position=position, label=label)
+            for position, label in enumerate(labels, start=1)
+        ])
+        await db.commit()
+        active_events_cache.invalidate()
         logger.info(f"Created bet event: {db_event.id}")
         return {"message": "Bet event created successfully", "eventId": db_event.id}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error creating bet event: {e}")
         raise HTTPException(status_code=500, detail="Failed to create bet event")
     finally:
-        db.close()
+        await db.close()
+
+async def load_event_options(db: AsyncSession, event_ids: List[int]) -> Dict[int, List[BetEventOption]]:
+    """Options of several events in one query, keyed by event and ordered by position"""
+    options = defaultdict(list)
+    if event_ids:
+        result = await db.execute(select(BetEventOption).where(
+            BetEventOption.betEventId.in_(event_ids)
+        ).order_by(BetEventOption.betEventId, BetEventOption.position))
+        for option in result.scalars():
+            options[option.betEventId].append(option)
+    return options
+
+def serialize_options(options: List[BetEventOption]) -> List[dict]:
+    return [
+        {"option": option.position, "label": option.label, "betAmount": option.betAmount}
+        for option in options
+    ]
+
+def option_label(options: List[BetEventOption], position: Optional[int]) -> Optional[str]:
+    return next((option.label for option in options if option.position == position), None)
 
 @app.get("/bet/events")
-def get_active_events():
-    """Get all active betting events"""
-    db = SessionLocal()
+async def get_active_events(if_none_match: Optional[str] = Header(None)):
+    """Get all active betting events; served from cache and revalidated with ETag/If-None-Match"""
+    cached = active_events_cache.get()
+    if cached:
+        body, etag = cached
+    else:
+        version = active_events_cache.version
+        db: AsyncSession = SessionLocal()
+        try:
+            result = await db.execute(select(BetEvent).where(BetEvent.isActive == True, BetEvent.isFinished == False))
+            events = result.scalars().all()
+            options = await load_event_options(db, [event.id for event in events])
+            body = json.dumps(jsonable_encoder({
+                "events": [
+                    {
+                        "id": event.id,
+                        "title": event.title,
+                        "description": event.description,
+                        "options": serialize_options(options[event.id]),
+                        "totalBetAmount": event.totalBetAmount,
+                        "createdAt": event.createdAt
+                    }
+                    for event in events
+                ]
+            })).encode()
+            etag = active_events_cache.store(body, version)
+        except Exception as e:
+            logger.error(f"Error getting active events: {e}")
+            raise HTTPException(status_code=500, detail="Failed to get active events")
+        finally:
+            await db.close()
+    
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def encode_events_cursor(event) -> str:
+    return f"{event.createdAt.isoformat()}|{event.id}"
+
+def decode_events_cursor(cursor: str):
     try:
-        events = db.query(BetEvent).filter(BetEvent.isActive == True, BetEvent.isFinished == False).all()
-        return {
-            "events": [
+        created_at, event_id = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at), int(event_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@app.get("/bet/events/finished")
+async def get_finished_events(
+    limit: int = 20,
+    before: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    summary: bool = False
+):
+    """Get finished betting events, newest first; pass nextCursor as before for the next page"""
+    limit = max(1, min(limit, 100))
+    db: AsyncSession = SessionLocal()
+    try:
+        query = select(BetEvent).where(BetEvent.isFinished == True)
+        if since:
+            query = query.where(BetEvent.createdAt >= datetime.combine(since, datetime.min.time()))
+        if until:
+            query = query.where(BetEvent.createdAt < datetime.combine(until + timedelta(days=1), datetime.min.time()))
+        if before:
+            created_at, event_id = decode_events_cursor(before)
+            query = query.where(tuple_(BetEvent.createdAt, BetEvent.id) < tuple_(created_at, event_id))
+        result = await db.execute(query.order_by(BetEvent.createdAt.desc(), BetEvent.id.desc()).limit(limit + 1))
+        events = result.scalars().all()
+        
+        page = events[:limit]
+        options = await load_event_options(db, [event.id for event in page])
+        if summary:
+            items = [
                 {
                     "id": event.id,
                     "title": event.title,
-                    "description": event.description,
-                    "option1": event.option1,
-                    "option2": event.option2,
-                    "totalBetAmount": event.totalBetAmount,
-                    "option1BetAmount": event.option1BetAmount,
-                    "option2BetAmount": event.option2BetAmount,
-                    "createdAt": event.createdAt
+                    "winningOption": event.winningOption,
+                    "winner": option_label(options[event.id], event.winningOption),
+                    "totalBetAmount": event.totalBetAmount
                 }
-                for event in events
+                for event in page
             ]
-        }
-    except Exception as e:
-        logger.error(f"Error getting active events: {e}")
-        raise HTTPException(status_code=500, detail="Failed to get active events")
-    finally:
-        db.close()
-
-@app.get("/bet/events/finished")
-def get_finished_events():
-    """Get all finished betting events"""
-    db = SessionLocal()
-    try:
-        events = db.query(BetEvent).filter(BetEvent.isFinished == True).all()
-        return {
-            "events": [
+        else:
+            items = [
                 {
                     "id": event.id,
                     "title": event.title,
                     "description": event.description,
-                    "option1": event.option1,
-                    "option2": event.option2,
+                    "options": serialize_options(options[event.id]),
                     "winningOption": event.winningOption,
                     "totalBetAmount": event.totalBetAmount,
-                    "option1BetAmount": event.option1BetAmount,
-                    "option2BetAmount": event.option2BetAmount,
                     "createdAt": event.createdAt
                 }
-                for event in events
+                for event in page
             ]
+        return {
+            "events": items,
+            "nextCursor": encode_events_cursor(page[-1]) if len(events) > limit else None
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting finished events: {e}")
         raise HTTPException(status_code=500, detail="Failed to get finished events")
     finally:
-        db.close()
+        await db.close()
 
 @app.post("/bet/place")
-def place_bet(bet: UserBetCreate):
+async def place_bet(bet: UserBetCreate):
     """Place a bet on an event"""
-    if bet.chosenOption not in [1, 2]:
-        raise HTTPException(status_code=400, detail="Chosen option must be 1 or 2")
-    
     if bet.amount <= 0:
         raise HTTPException(status_code=400, detail="Bet amount must be positive")
     
-    db = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
-        event = db.query(BetEvent).filter(
+        result = await db.execute(select(BetEvent, BetEventOption.id).outerjoin(BetEventOption, and_(
+            BetEventOption.betEventId == BetEvent.id,
+            BetEventOption.position == bet.chosenOption
+        )).where(
             BetEvent.id == bet.betEventId,
             BetEvent.isActive == True,
             BetEvent.isFinished == False
-        ).first()
+        ))
+        row = result.first()
         
-        if not event:
+        if not row:
             raise HTTPException(status_code=404, detail="Event not found or not active")
+        event, option_id = row
+        if option_id is None:
+            raise HTTPException(status_code=400, detail="Chosen option does not exist for this event")
         
-        existing_bet = db.query(UserBet).filter(
+        result = await db.execute(select(UserBet.id).where(
             UserBet.userId == bet.userId,
             UserBet.betEventId == bet.betEventId
-        ).first()
+        ))
         
-        if existing_bet:
+        if result.first():
             raise HTTPException(status_code=400, detail="User already placed a bet on this event")
         
-        if not check_user_balance(bet.userId, bet.amount):
+        debit_status = await debit_user_balance(
+            bet.userId, bet.amount, f"Bet on {event.title}", f"bet:{bet.betEventId}:{bet.userId}:{bet.amount}"
+        )
+        if debit_status == 400:
             raise HTTPException(status_code=400, detail="Insufficient balance")
-        
-        if not subtract_user_balance(bet.userId, bet.amount, f"Bet on {event.title}"):
+        if debit_status == 409:
+            raise HTTPException(status_code=409, detail="A different bet is already being placed for this user")
+        if debit_status != 200:
             raise HTTPException(status_code=500, detail="Failed to subtract balance")
         
         db_bet = UserBet(
@@ -205,164 +342,316 @@ def place_bet(bet: UserBetCreate):
             amount=bet.amount
         )
         db.add(db_bet)
+        try:
+            await db.flush()
+        except IntegrityError:
+            # A concurrent request for the same user won; its debit key made ours a replay
+            raise HTTPException(status_code=400, detail="User already placed a bet on this event")
         
-        event.totalBetAmount += bet.amount
-        if bet.chosenOption == 1:
-            event.option1BetAmount += bet.amount
-        else:
-            event.option2BetAmount += bet.amount
+        # Increment in SQL as the last statements so the event and option rows are locked only until commit
+        result = await db.execute(update(BetEvent).where(
+            BetEvent.id == bet.betEventId,
+            BetEvent.isActive == True,
+            BetEvent.isFinished == False
+        ).values(totalBetAmount=BetEvent.totalBetAmount + bet.amount))
+        if result.rowcount == 0:
+            # Finalized or cancelled while we were debiting: give the stake back
+            event_title = event.title
+            await db.rollback()
+            refunded = await add_user_balances([{
+                "clientId": bet.userId,
+                "amount": bet.amount,
+                "description": f"Refund for closed event: {event_title}",
+                "operationKey": f"bet-void:{bet.betEventId}:{bet.userId}:{bet.amount}"
+            }])
+            if not refunded:
+                logger.error(f"Failed to refund {bet.amount} to {bet.userId} for closed event {bet.betEventId}")
+            raise HTTPException(status_code=404, detail="Event not found or not active")
+        await db.execute(update(BetEventOption).where(
+            BetEventOption.id == option_id
+        ).values(betAmount=BetEventOption.betAmount + bet.amount))
         
-        db.commit()
-        db.refresh(db_bet)
+        await db.commit()
+        active_events_cache.invalidate()
+        await publish_event_odds(db, event)
         
         logger.info(f"User {bet.userId} placed bet {db_bet.id} on event {bet.betEventId}")
         return {"message": "Bet placed successfully", "betId": db_bet.id}
         
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error placing bet: {e}")
         raise HTTPException(status_code=500, detail="Failed to place bet")
     finally:
-        db.close()
+        await db.close()
 
 @app.post("/bet/finalize")
-def finalize_bet(finalize_data: BetFinalize):
-    """Finalize a betting event and distribute winnings"""
-    if finalize_data.winningOption not in [1, 2]:
-        raise HTTPException(status_code=400, detail="Winning option must be 1 or 2")
-    
-    db = SessionLocal()
+async def finalize_bet(finalize_data: BetFinalize):
+    """Finalize a betting event and queue its payouts for the settlement worker"""
+    db: AsyncSession = SessionLocal()
     try:
-        event = db.query(BetEvent).filter(
+        result = await db.execute(select(BetEvent).where(
             BetEvent.id == finalize_data.betEventId,
             BetEvent.isActive == True,
             BetEvent.isFinished == False
-        ).first()
+        ).with_for_update())
+        event = result.scalars().first()
         
         if not event:
             raise HTTPException(status_code=404, detail="Event not found or already finished")
         
-        winning_bets = db.query(UserBet).filter(
+        result = await db.execute(select(BetEventOption.label).where(
+            BetEventOption.betEventId == event.id,
+            BetEventOption.position == finalize_data.winningOption
+        ))
+        winning_label = result.scalar()
+        if winning_label is None:
+            raise HTTPException(status_code=400, detail="Winning option does not exist for this event")
+        
+        # Plain rows rather than ORM objects: events can have tens of thousands of winners
+        result = await db.execute(select(UserBet.id, UserBet.userId, UserBet.amount).where(
             UserBet.betEventId == finalize_data.betEventId,
             UserBet.chosenOption == finalize_data.winningOption
-        ).all()
-        
-        winning_total = sum(bet.amount for bet in winning_bets)
+        ).order_by(UserBet.id))
+        winning_bets = result.all()
         
-        if winning_total == 0:
+        if not winning_bets:
             event.isFinished = True
             event.winningOption = finalize_data.winningOption
-            db.commit()
+            await db.commit()
+            active_events_cache.invalidate()
+            await publish_event_odds(db, event)
             logger.info(f"Event {event.id} finished with no winners")
             return {"message": "Event finished with no winners"}
         
         total_pool = event.totalBetAmount
-        distributions = []
+        winnings = split_pool(total_pool, [bet.amount for bet in winning_bets])
+        distributions = [
+            {
+                "betId": bet.id,
+                "userId": bet.userId,
+                "originalBet": bet.amount,
+                "winnings": amount,
+                "profit": amount - bet.amount
+            }
+            for bet, amount in zip(winning_bets, winnings)
+        ]
         
-        for bet in winning_bets:
-            proportion = bet.amount / winning_total
-            winnings = int(total_pool * proportion)
-            
-            if add_user_balance(
-                bet.userId, 
-                winnings, 
-                f"Winnings from {event.title} - Option {finalize_data.winningOption}"
-            ):
-                distributions.append({
-                    "userId": bet.userId,
-                    "originalBet": bet.amount,
-                    "winnings": winnings,
-                    "profit": winnings - bet.amount
-                })
-                logger.info(f"Distributed {winnings} to user {bet.userId}")
+        job = SettlementJob(
+            betEventId=event.id,
+            totalAmount=total_pool
+        )
+        db.add(job)
+        await db.flush()
+        description = f"Winnings from {event.title} - {winning_label}"
+        await db.execute(insert(SettlementPayout), [
+            {
+                "jobId": job.id,
+                "betId": d["betId"],
+                "userId": d["userId"],
+                "amount": d["winnings"],
+                "description": description,
+                "operationKey": f"bet-payout:{event.id}:{d['betId']}"
+            }
+            for d in distributions
+        ])
         
         event.isFinished = True
         event.winningOption = finalize_data.winningOption
-        db.commit()
+        await db.commit()
+        active_events_cache.invalidate()
+        await publish_event_odds(db, event)
+        settlement_worker.notify()
         
-        logger.info(f"Finalized event {event.id} with {len(distributions)} winners")
+        logger.info(f"Finalized event {event.id}; settlement job {job.id} queued {len(distributions)} payouts")
         return {
-            "message": "Event finalized successfully",
+            "message": "Event finalized; payouts are being settled",
+            "jobId": job.id,
             "winningOption": finalize_data.winningOption,
+            "winner": winning_label,
             "totalPool": total_pool,
             "winnersCount": len(distributions),
             "distributions": distributions
         }
         
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error finalizing bet: {e}")
         raise HTTPException(status_code=500, detail="Failed to finalize bet")
     finally:
-        db.close()
+        await db.close()
 
-@app.get("/bet/user/{user_id}")
-def get_user_bets(user_id: str):
-    """Get all bets for a specific user"""
-    db = SessionLocal()
+async def settlement_progress(db: AsyncSession, job: SettlementJob) -> dict:
+    counts = {"pending": 0, "paid": 0, "failed": 0}
+    amounts = {"pending": 0, "paid": 0, "failed": 0}
+    result = await db.execute(select(
+        SettlementPayout.status, func.count(SettlementPayout.id), func.sum(SettlementPayout.amount)
+    ).where(SettlementPayout.jobId == job.id).group_by(SettlementPayout.status))
+    for status, count, amount in result.all():
+        counts[status] = count
+        amounts[status] = amount or 0
+    return {
+        "jobId": job.id,
+        "betEventId": job.betEventId,
+        "status": job.status,
+        "total": sum(counts.values()),
+        "paid": counts["paid"],
+        "failed": counts["failed"],
+        "pending": counts["pending"],
+        "totalAmount": job.totalAmount,
+        "paidAmount": amounts["paid"],
+        "createdAt": job.createdAt,
+        "finishedAt": job.finishedAt
+    }
+
+@app.get("/bet/settlement/{job_id}")
+async def get_settlement_job(job_id: int):
+    """Get payout progress for a settlement job"""
+    db: AsyncSession = SessionLocal()
     try:
-        bets = db.query(UserBet).filter(UserBet.userId == user_id).all()
+        job = await db.get(SettlementJob, job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Settlement job not found")
+        return await settlement_progress(db, job)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting settlement job: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get settlement job")
+    finally:
+        await db.close()
+
+@app.post("/bet/settlement/{job_id}/retry")
+async def retry_settlement_job(job_id: int):
+    """Requeue payouts that exhausted their retries"""
+    db: AsyncSession = SessionLocal()
+    try:
+        job = await db.get(SettlementJob, job_id, with_for_update=True)
+        if not job:
+            raise HTTPException(status_code=404, detail="Settlement job not found")
         
-        bet_details = []
-        for bet in bets:
-            event = db.query(BetEvent).filter(BetEvent.id == bet.betEventId).first()
-            if event:
-                bet_details.append({
-                    "betId": bet.id,
-                    "eventId": event.id,
-                    "eventTitle": event.title,
-                    "chosenOption": bet.chosenOption,
-                    "chosenOptionText": event.option1 if bet.chosenOption == 1 else event.option2,
-                    "amount": bet.amount,
-                    "isFinished": event.isFinished,
-                    "winningOption": event.winningOption,
-                    "isWinner": event.isFinished and event.winningOption == bet.chosenOption,
-                    "createdAt": bet.createdAt
-                })
+        result = await db.execute(update(SettlementPayout).where(
+            SettlementPayout.jobId == job_id,
+            SettlementPayout.status == "failed"
+        ).values(
+            status="pending",
+            attempts=0,
+            nextAttemptAt=datetime.utcnow()
+        ))
+        requeued = result.rowcount
+        if requeued:
+            job.status = "running"
+            job.finishedAt = None
+        await db.commit()
+        settlement_worker.notify()
         
-        return {"bets": bet_details}
+        logger.info(f"Requeued {requeued} failed payouts for settlement job {job_id}")
+        return {"message": "Failed payouts requeued", "requeued": requeued}
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error retrying settlement job: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retry settlement job")
+    finally:
+        await db.close()
+
+@app.get("/bet/user/{user_id}")
+async def get_user_bets(user_id: str, limit: int = 10, before: Optional[int] = None, status: Optional[str] = None):
+    """Get a page of a user's bets, newest first; pass nextCursor as before for the next page"""
+    if status not in (None, "active", "finished"):
+        raise HTTPException(status_code=400, detail="Status must be active or finished")
+    limit = max(1, min(limit, 100))
+    
+    db: AsyncSession = SessionLocal()
+    try:
+        query = select(
+            UserBet.id,
+            UserBet.chosenOption,
+            UserBet.amount,
+            UserBet.createdAt,
+            BetEvent.id.label("eventId"),
+            BetEvent.title,
+            BetEvent.isFinished,
+            BetEvent.winningOption,
+            BetEventOption.label.label("chosenOptionText")
+        ).join(BetEvent, BetEvent.id == UserBet.betEventId).join(BetEventOption, and_(
+            BetEventOption.betEventId == UserBet.betEventId,
+            BetEventOption.position == UserBet.chosenOption
+        )).where(UserBet.userId == user_id)
+        if status == "active":
+            query = query.where(BetEvent.isActive == True, BetEvent.isFinished == False)
+        elif status == "finished":
+            query = query.where(BetEvent.isFinished == True)
+        if before is not None:
+            query = query.where(UserBet.id < before)
+        # One row past the page tells us whether there is a next page
+        rows = (await db.execute(query.order_by(UserBet.id.desc()).limit(limit + 1))).all()
         
+        page = rows[:limit]
+        return {
+            "bets": [
+                {
+                    "betId": row.id,
+                    "eventId": row.eventId,
+                    "eventTitle": row.title,
+                    "chosenOption": row.chosenOption,
+                    "chosenOptionText": row.chosenOptionText,
+                    "amount": row.amount,
+                    "isFinished": row.isFinished,
+                    "winningOption": row.winningOption,
+                    "isWinner": row.isFinished and row.winningOption == row.chosenOption,
+                    "createdAt": row.createdAt
+                }
+                for row in page
+            ],
+            "nextCursor": page[-1].id if len(rows) > limit else None
+        }
+    
     except Exception as e:
         logger.error(f"Error getting user bets: {e}")
         raise HTTPException(status_code=500, detail="Failed to get user bets")
     finally:
-        db.close()
+        await db.close()
 
 @app.get("/bet/event/{event_id}")
-def get_event_details(event_id: str):
+async def get_event_details(event_id: int):
     """Get detailed information about a specific event"""
-    db = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
-        event = db.query(BetEvent).filter(BetEvent.id == event_id).first()
+        event = await db.get(BetEvent, event_id)
         if not event:
             raise HTTPException(status_code=404, detail="Event not found")
         
-        bets = db.query(UserBet).filter(UserBet.betEventId == event_id).all()
+        result = await db.execute(select(UserBet.chosenOption, func.count(UserBet.id)).where(
+            UserBet.betEventId == event_id
+        ).group_by(UserBet.chosenOption))
+        bet_counts = dict(result.all())
+        options = (await load_event_options(db, [event_id]))[event_id]
         
         return {
             "event": {
                 "id": event.id,
                 "title": event.title,
                 "description": event.description,
-                "option1": event.option1,
-                "option2": event.option2,
+                "options": [
+                    {**option, "bets": bet_counts.get(option["option"], 0)}
+                    for option in serialize_options(options)
+                ],
                 "isActive": event.isActive,
                 "isFinished": event.isFinished,
                 "winningOption": event.winningOption,
                 "totalBetAmount": event.totalBetAmount,
-                "option1BetAmount": event.option1BetAmount,
-                "option2BetAmount": event.option2BetAmount,
                 "createdAt": event.createdAt
             },
-            "totalBets": len(bets),
-            "option1Bets": len([b for b in bets if b.chosenOption == 1]),
-            "option2Bets": len([b for b in bets if b.chosenOption == 2])
+            "totalBets": sum(bet_counts.values())
         }
         
     except HTTPException:
@@ -371,32 +660,101 @@ def get_event_details(event_id: str):
         logger.error(f"Error getting event details: {e}")
         raise HTTPException(status_code=500, detail="Failed to get event details")
     finally:
-        db.close()
+        await db.close()
+
+def event_odds(event: BetEvent, options: List[BetEventOption]) -> dict:
+    status = "finished" if event.isFinished else ("open" if event.isActive else "cancelled")
+    return odds_snapshot(
+        event.id, [option.betAmount for option in options],
+        status=status, winning_option=event.winningOption
+    )
+
+async def publish_event_odds(db: AsyncSession, event: BetEvent) -> None:
+    """Push the event's committed pool to odds watchers; costs nothing when nobody watches"""
+    if not odds_feed.watching(event.id):
+        return
+    try:
+        options = (await load_event_options(db, [event.id]))[event.id]
+        odds_feed.publish(event_odds(event, options))
+    except Exception as e:
+        logger.warning(f"Failed to publish odds for event {event.id}: {e}")
+
+@app.get("/bet/event/{event_id}/odds")
+async def stream_event_odds(event_id: int, request: Request):
+    """Server-sent pool and odds updates for one event, coalesced to one per ODDS_COALESCE_MS"""
+    db: AsyncSession = SessionLocal()
+    try:
+        event = await db.get(BetEvent, event_id)
+        options = (await load_event_options(db, [event_id]))[event_id]
+    finally:
+        await db.close()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    snapshot = event_odds(event, options)
+    
+    async def event_stream():
+        channel = odds_feed.subscribe(event_id, snapshot) if snapshot["status"] == "open" else None
+        try:
+            if channel is None:
+                yield f"id: 0\nevent: odds\ndata: {json.dumps(snapshot)}\n\n"
+                return
+            last_seq = None
+            while not await request.is_disconnected():
+                changed = channel.changed
+                if channel.seq != last_seq:
+                    last_seq = channel.seq
+                    yield odds_feed.format_event(channel)
+                    if channel.snapshot["status"] != "open":
+                        return
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=ODDS_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            if channel is not None:
+                odds_feed.unsubscribe(event_id, channel)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.delete("/bet/event/{event_id}")
-def cancel_bet_event(event_id: str):
+async def cancel_bet_event(event_id: int):
     """Cancel a betting event and refund all bets"""
-    db = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
-        event = db.query(BetEvent).filter(
+        result = await db.execute(select(BetEvent).where(
             BetEvent.id == event_id,
             BetEvent.isActive == True,
             BetEvent.isFinished == False
-        ).first()
+        ).with_for_update())
+        event = result.scalars().first()
         
         if not event:
             raise HTTPException(status_code=404, detail="Event not found or already finished")
         
-        bets = db.query(UserBet).filter(UserBet.betEventId == event_id).all()
+        result = await db.execute(select(UserBet).where(UserBet.betEventId == event_id))
+        bets = result.scalars().all()
         
-        refunded_count = 0
-        for bet in bets:
-            if add_user_balance(bet.userId, bet.amount, f"Refund for cancelled event: {event.title}"):
-                refunded_count += 1
-                logger.info(f"Refunded {bet.amount} to user {bet.userId}")
+        refunds = [
+            {
+                "clientId": bet.userId,
+                "amount": bet.amount,
+                "description": f"Refund for cancelled event: {event.title}",
+                "operationKey": f"bet-refund:{event.id}:{bet.id}"
+            }
+            for bet in bets
+        ]
+        if refunds and not await add_user_balances(refunds):
+            raise HTTPException(status_code=500, detail="Failed to refund bets")
+        refunded_count = len(refunds)
         
         event.isActive = False
-        db.commit()
+        await db.commit()
+        active_events_cache.invalidate()
+        await publish_event_odds(db, event)
         
         logger.info(f"Cancelled event {event.id} and refunded {refunded_count} bets")
         return {
@@ -406,14 +764,14 @@ def cancel_bet_event(event_id: str):
         }
         
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error cancelling event: {e}")
         raise HTTPException(status_code=500, detail="Failed to cancel event")
     finally:
-        db.close()
+        await db.close()
 
 if __name__ == "__main__":
     import uvicorn
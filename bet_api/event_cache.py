@@ -0,0 +1,46 @@
+from typing import Optional, Tuple
+import hashlib
+import time
+
+class ResponseCache:
+    """In-process cache of one serialized response body plus its ETag.
+
+    Writers call invalidate() after committing a change. A rebuild that raced
+    with an invalidation is discarded instead of stored (the version check), and
+    ttl bounds staleness when other processes change the data.
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self.version = 0
+        self.body: Optional[bytes] = None
+        self.etag: Optional[str] = None
+        self.expires_at = 0.0
+
+    def get(self) -> Optional[Tuple[bytes, str]]:
+        if self.body is None or time.monotonic() >= self.expires_at:
+            return None
+        return self.body, self.etag
+
+    def store(self, body: bytes, version: int) -> str:
+        etag = make_etag(body)
+        if version == self.version:
+            self.body = body
+            self.etag = etag
+            self.expires_at = time.monotonic() + self.ttl
+        return etag
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self.body = None
+        self.etag = None
+
+def make_etag(body: bytes) -> str:
+    # Content hash, so every process agrees on the tag for the same data
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
@@ -1,8 +1,7 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 class BetEventCreate(BaseModel):
     title: str
     description: Optional[str] = None
-    option1: str
-    option2: str
+    options: List[str]  # labels in order; positions start at 1
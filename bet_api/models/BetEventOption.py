@@ -0,0 +1,26 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, Integer, UniqueConstraint
+from datetime import datetime
+
+Base = declarative_base()
+
+class BetEventOption(Base):
+    __tablename__ = "bet_event_option"
+    __table_args__ = (UniqueConstraint("betEventId", "position", name="UQ_bet_event_option_event_position"),)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    betEventId = Column(Integer, nullable=False)
+    position = Column(Integer, nullable=False)  # 1-based; what chosenOption and winningOption refer to
+    label = Column(String, nullable=False)
+    betAmount = Column(Integer, default=0, nullable=False)
+    createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __init__(self, betEventId: int, position: int, label: str):
+        self.betEventId = betEventId
+        self.position = position
+        self.label = label
+        self.betAmount = 0
+
+    def __repr__(self):
+        return (f"BetEventOption(id={self.id}, betEventId={self.betEventId}, position={self.position}, "
+                f"label={self.label}, betAmount={self.betAmount})")
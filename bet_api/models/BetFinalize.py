@@ -2,4 +2,4 @@ from pydantic import BaseModel
 
 class BetFinalize(BaseModel):
     betEventId: int
-    winningOption: int  # 1 or 2
+    winningOption: int  # option position, starting at 1
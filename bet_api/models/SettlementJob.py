@@ -0,0 +1,24 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, Integer
+from datetime import datetime
+
+Base = declarative_base()
+
+class SettlementJob(Base):
+    __tablename__ = "settlement_job"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    betEventId = Column(Integer, nullable=False, unique=True)
+    status = Column(String, default="running", nullable=False)  # running, completed, completed_with_failures
+    totalAmount = Column(Integer, default=0, nullable=False)
+    finishedAt = Column(DateTime, nullable=True)
+    createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __init__(self, betEventId: int, totalAmount: int):
+        self.betEventId = betEventId
+        self.totalAmount = totalAmount
+        self.status = "running"
+
+    def __repr__(self):
+        return (f"SettlementJob(id={self.id}, betEventId={self.betEventId}, status={self.status}, "
+                f"totalAmount={self.totalAmount})")
@@ -0,0 +1,36 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, Integer
+from datetime import datetime
+
+Base = declarative_base()
+
+class SettlementPayout(Base):
+    __tablename__ = "settlement_payout"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    jobId = Column(Integer, nullable=False)
+    betId = Column(Integer, nullable=False, unique=True)
+    userId = Column(String, nullable=False)
+    amount = Column(Integer, nullable=False)
+    description = Column(String, nullable=False)
+    operationKey = Column(String, nullable=False)
+    status = Column(String, default="pending", nullable=False)  # pending, paid, failed
+    attempts = Column(Integer, default=0, nullable=False)
+    nextAttemptAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    lastError = Column(String, nullable=True)
+    createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __init__(self, jobId: int, betId: int, userId: str, amount: int, description: str, operationKey: str):
+        self.jobId = jobId
+        self.betId = betId
+        self.userId = userId
+        self.amount = amount
+        self.description = description
+        self.operationKey = operationKey
+        self.status = "pending"
+        self.attempts = 0
+        self.nextAttemptAt = datetime.utcnow()
+
+    def __repr__(self):
+        return (f"SettlementPayout(id={self.id}, jobId={self.jobId}, betId={self.betId}, "
+                f"userId={self.userId}, amount={self.amount}, status={self.status})")
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, String, DateTime, Integer
+from sqlalchemy import Column, String, DateTime, Integer, UniqueConstraint
 import uuid
 from datetime import datetime
 
@@ -7,10 +7,11 @@ Base = declarative_base()
 
 class UserBet(Base):
     __tablename__ = "user_bet"
+    __table_args__ = (UniqueConstraint("userId", "betEventId", name="UQ_user_bet_user_event"),)
     id = Column(Integer, primary_key=True, autoincrement=True)
     userId = Column(String, nullable=False)
     betEventId = Column(Integer, nullable=False)
-    chosenOption = Column(Integer, nullable=False)  # 1 or 2
+    chosenOption = Column(Integer, nullable=False)  # bet_event_option position
     amount = Column(Integer, nullable=False)
     createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
     updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -3,5 +3,5 @@ from pydantic import BaseModel
 class UserBetCreate(BaseModel):
     userId: str
     betEventId: int
-    chosenOption: int  # 1 or 2
+    chosenOption: int  # option position, starting at 1
     amount: int
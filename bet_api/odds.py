@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+import asyncio
+import json
+
+def odds_snapshot(event_id: int, option_amounts: List[int], status: str = "open",
+                  winning_option: Optional[int] = None) -> dict:
+    """Pool state plus decimal odds (payout per coin staked) for each option, in position order."""
+    total = sum(option_amounts)
+    return {
+        "eventId": event_id,
+        "status": status,  # open, finished, cancelled
+        "winningOption": winning_option,
+        "totalBetAmount": total,
+        "options": [
+            {"option": position, "betAmount": amount, "odds": round(total / amount, 4) if amount else None}
+            for position, amount in enumerate(option_amounts, start=1)
+        ],
+        "at": datetime.utcnow().isoformat()
+    }
+
+class OddsChannel:
+    def __init__(self, snapshot: dict):
+        self.snapshot = snapshot
+        self.seq = 0
+        self.changed = asyncio.Event()
+        self.subscribers = 0
+        self.last_flush = 0.0
+        self.pending = False
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+class OddsFeed:
+    """Per-event fan-out of pool/odds snapshots, coalesced to one update per interval.
+
+    publish() only records the latest snapshot; a flush at most every
+    coalesce_ms wakes the subscribers, who always read the newest snapshot, so a
+    burst of bets costs one push and slow consumers simply skip intermediate
+    states. Channels exist only while someone is watching the event.
+    """
+
+    def __init__(self, coalesce_ms: int = 500):
+        self.interval = coalesce_ms / 1000
+        self.channels: Dict[int, OddsChannel] = {}
+
+    def subscribe(self, event_id: int, snapshot: dict) -> OddsChannel:
+        channel = self.channels.get(event_id)
+        if channel is None:
+            channel = self.channels[event_id] = OddsChannel(snapshot)
+        channel.subscribers += 1
+        return channel
+
+    def unsubscribe(self, event_id: int, channel: OddsChannel) -> None:
+        channel.subscribers -= 1
+        if channel.subscribers <= 0 and self.channels.get(event_id) is channel:
+            if channel.flush_handle:
+                channel.flush_handle.cancel()
+            del self.channels[event_id]
+
+    def watching(self, event_id: int) -> bool:
+        return event_id in self.channels
+
+    def publish(self, snapshot: dict) -> None:
+        channel = self.channels.get(snapshot["eventId"])
+        if channel is None:
+            return
+        channel.snapshot = snapshot
+        # Final states go out immediately so watchers can close their stream
+        if snapshot["status"] != "open":
+            self.flush(channel)
+            return
+        if channel.pending:
+            return
+        loop = asyncio.get_running_loop()
+        delay = channel.last_flush + self.interval - loop.time()
+        if delay <= 0:
+            self.flush(channel)
+        else:
+            channel.pending = True
+            channel.flush_handle = loop.call_later(delay, self.flush, channel)
+
+    def flush(self, channel: OddsChannel) -> None:
+        if channel.flush_handle:
+            channel.flush_handle.cancel()
+            channel.flush_handle = None
+        channel.pending = False
+        channel.last_flush = asyncio.get_running_loop().time()
+        channel.seq += 1
+        changed, channel.changed = channel.changed, asyncio.Event()
+        changed.set()
+
+    def format_event(self, channel: OddsChannel) -> str:
+        return f"id: {channel.seq}\nevent: odds\ndata: {json.dumps(channel.snapshot)}\n\n"
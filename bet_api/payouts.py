@@ -0,0 +1,20 @@
+from typing import List, Sequence
+
+def split_pool(pool: int, stakes: Sequence[int]) -> List[int]:
+    """Split pool across stakes pro rata in whole coins, summing exactly to pool.
+
+    Every stake gets floor(pool * stake / total) from one integer divmod pass. The
+    few coins left over (fewer than len(stakes)) go one each to the largest
+    remainders, ties to the earlier stake, so the same bets always pay the same.
+    """
+    total = sum(stakes)
+    if total <= 0:
+        return [0] * len(stakes)
+    parts = [divmod(pool * stake, total) for stake in stakes]
+    shares = [share for share, _ in parts]
+    remainders = [remainder for _, remainder in parts]
+    leftover = pool - sum(shares)
+    # sorted() is stable, so equal remainders keep bet order
+    for index in sorted(range(len(remainders)), key=remainders.__getitem__, reverse=True)[:leftover]:
+        shares[index] += 1
+    return shares
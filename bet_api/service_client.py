@@ -0,0 +1,56 @@
+from typing import Optional
+import asyncio
+import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+class ServiceUnavailable(Exception):
+    """Raised when a dependency cannot be reached after all retries."""
+
+class ServiceClient:
+    """Keep-alive HTTP client for balance_api with a timeout, a cap on in-flight calls and retries."""
+
+    def __init__(self, name: str, base_url: str, timeout: float = 5.0, max_connections: int = 50,
+                 max_concurrency: int = 50, retries: int = 3, retry_backoff: float = 0.2):
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def start(self) -> None:
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        )
+
+    async def close(self) -> None:
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def post(self, path: str, json=None, idempotency_key: Optional[str] = None,
+                   retry: bool = False) -> httpx.Response:
+        """POST, retried on connection errors and 5xx only with an idempotency key or retry=True."""
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        attempts = self.retries if retry or idempotency_key else 1
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self.semaphore:
+                    response = await self.client.post(path, json=json, headers=headers)
+                if response.status_code < 500 or attempt == attempts:
+                    return response
+                logger.warning(f"{self.name} POST {path} returned {response.status_code} (attempt {attempt}/{attempts})")
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__} {e}".strip()
+                if attempt == attempts:
+                    raise ServiceUnavailable(f"{self.name} POST {path} failed: {error}") from e
+                logger.warning(f"{self.name} POST {path} failed: {error} (attempt {attempt}/{attempts})")
+            await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
@@ -0,0 +1,145 @@
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional
+import asyncio
+import logging
+from models.SettlementJob import SettlementJob
+from models.SettlementPayout import SettlementPayout
+
+logger = logging.getLogger(__name__)
+
+class SettlementWorker:
+    """Background task that pays out settlement_payout rows in chunks.
+
+    Pending payouts are claimed with FOR UPDATE SKIP LOCKED, so several bet_api
+    processes can run a worker each. Every payout carries its own operationKey,
+    so a chunk that is paid but not marked (crash, timeout) is safe to send again.
+    A failed chunk is retried with exponential backoff until max_attempts, after
+    which its payouts are marked failed and can be requeued from the API.
+    """
+
+    def __init__(self, session_factory, pay: Callable[[List[dict]], Awaitable[bool]], chunk_size: int = 100,
+                 max_attempts: int = 5, retry_backoff: float = 5.0, poll_interval: float = 2.0):
+        self.session_factory = session_factory
+        self.pay = pay
+        self.chunk_size = chunk_size
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+        self.stopped: Optional[asyncio.Event] = None
+        self.wakeup: Optional[asyncio.Event] = None
+        self.task = None
+
+    def start(self) -> None:
+        # Created here rather than in __init__ so they bind to the server's event loop
+        self.stopped = asyncio.Event()
+        self.wakeup = asyncio.Event()
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if not self.task:
+            return
+        self.stopped.set()
+        self.wakeup.set()
+        done, _ = await asyncio.wait([self.task], timeout=10)
+        if not done:
+            # Stuck mid-chunk: the chunk's transaction rolls back and its payouts stay pending
+            logger.warning("Settlement worker did not stop in time; cancelling it")
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    def notify(self) -> None:
+        """Skip the poll wait, e.g. right after a job is created."""
+        if self.wakeup:
+            self.wakeup.set()
+
+    async def run(self) -> None:
+        logger.info("Settlement worker started")
+        while not self.stopped.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Settlement worker error: {e}")
+                processed = 0
+            if not processed:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self.wakeup.clear()
+        logger.info("Settlement worker stopped")
+
+    async def run_once(self) -> int:
+        """Pay one chunk of due payouts; returns how many were attempted."""
+        db: AsyncSession = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            result = await db.execute(select(SettlementPayout).where(
+                SettlementPayout.status == "pending",
+                SettlementPayout.nextAttemptAt <= now
+            ).order_by(SettlementPayout.id).limit(self.chunk_size).with_for_update(skip_locked=True))
+            payouts = result.scalars().all()
+            if not payouts:
+                return 0
+
+            paid = await self.pay([
+                {
+                    "clientId": payout.userId,
+                    "amount": payout.amount,
+                    "description": payout.description,
+                    "operationKey": payout.operationKey
+                }
+                for payout in payouts
+            ])
+
+            now = datetime.utcnow()
+            for payout in payouts:
+                payout.attempts += 1
+                if paid:
+                    payout.status = "paid"
+                    payout.lastError = None
+                elif payout.attempts >= self.max_attempts:
+                    payout.status = "failed"
+                    payout.lastError = "Balance API batch failed"
+                else:
+                    payout.lastError = "Balance API batch failed"
+                    payout.nextAttemptAt = now + timedelta(seconds=self.retry_backoff * 2 ** (payout.attempts - 1))
+            await db.flush()
+
+            for job_id in sorted({payout.jobId for payout in payouts}):
+                await self.finish_job_if_done(db, job_id)
+            await db.commit()
+
+            if paid:
+                logger.info(f"Paid {len(payouts)} settlement payouts ({sum(p.amount for p in payouts)} coins)")
+            else:
+                logger.warning(f"Failed to pay {len(payouts)} settlement payouts; will retry")
+            return len(payouts)
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            await db.close()
+
+    async def finish_job_if_done(self, db: AsyncSession, job_id: int) -> None:
+        # Lock the job first so concurrent workers finishing its last chunks count one
+        # after the other; otherwise each sees the other's payouts still pending
+        result = await db.execute(select(SettlementJob).where(
+            SettlementJob.id == job_id
+        ).with_for_update())
+        job = result.scalar_one()
+        if job.status != "running":
+            return
+        result = await db.execute(select(SettlementPayout.status, func.count(SettlementPayout.id)).where(
+            SettlementPayout.jobId == job_id
+        ).group_by(SettlementPayout.status))
+        counts = dict(result.all())
+        if counts.get("pending"):
+            return
+        job.status = "completed_with_failures" if counts.get("failed") else "completed"
+        job.finishedAt = datetime.utcnow()
+        logger.info(f"Settlement job {job_id} for event {job.betEventId} {job.status}")
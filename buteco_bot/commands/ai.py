@@ -26,6 +26,7 @@ def ai_commands(bot):
     ):
         """Envia um prompt para o serviço de IA e retorna a resposta."""
 
+        await interaction.response.defer()
         sender = await get_or_create_user(str(interaction.user.id), interaction.user.display_name)
         
         amount = int(os.getenv('AI_USAGE_COST', 100))
@@ -34,25 +35,26 @@ def ai_commands(bot):
             "amount": amount,
             "description": f"Pagamento por uso do serviço de IA: {prompt}"
         }
-
-        status, response = await make_api_request(
-            session, 'POST', f"{BALANCE_API_URL}/balance/subtract", data
-        )
-        
-        if status != 200:
-            embed = discord.Embed(
-                title="❌ Falha no pagamento da AI",
-                description="Falha ao pagar pelo uso do serviço de IA. Verifique seu saldo.",
-                color=discord.Color.red()
-            )
-
-        await interaction.response.defer()
         payload = {"prompt": prompt}
         if provider:
             payload["provider"] = provider
         if system_prompt:
             payload["systemPrompt"] = system_prompt
+        
         async with aiohttp.ClientSession() as session:
+            status, response = await make_api_request(
+                session, 'POST', f"{BALANCE_API_URL}/balance/debit-if-sufficient", data
+            )
+            
+            if status != 200:
+                embed = discord.Embed(
+                    title="❌ Falha no pagamento da AI",
+                    description="Falha ao pagar pelo uso do serviço de IA. Verifique seu saldo.",
+                    color=discord.Color.red()
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            
             status, response = await make_api_request(
                 session, 'POST', f"{AI_API_URL}/GenAI/generate", payload
             )
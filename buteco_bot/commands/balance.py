@@ -1,6 +1,7 @@
 from discord import app_commands
 import discord
 import aiohttp
+import asyncio
 from tools.utils import get_or_create_user, make_api_request, requires_registration
 from tools.constants import BALANCE_API_URL, CLIENT_API_URL
 
@@ -47,29 +48,6 @@ def balance_commands(bot):
             return
         
         async with aiohttp.ClientSession() as session:
-            status, balance_data = await make_api_request(
-                session, 'GET', f"{BALANCE_API_URL}/balance/{sender['id']}"
-            )
-            
-            if status != 200:
-                embed = discord.Embed(
-                    title="❌ Erro",
-                    description="Falha ao verificar saldo.",
-                    color=discord.Color.red()
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-            
-            current_balance = balance_data.get('balance', 0)
-            if current_balance < amount:
-                embed = discord.Embed(
-                    title="❌ Saldo Insuficiente",
-                    description=f"Você tem {current_balance:,} moedas, mas precisa de {amount:,} moedas.",
-                    color=discord.Color.red()
-                )
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                return
-            
             transfer_data = {
                 "senderId": sender['id'],
                 "receiverId": receiver['id'],
@@ -88,7 +66,13 @@ def balance_commands(bot):
                     color=discord.Color.green()
                 )
                 embed.add_field(name="Descrição", value=description, inline=False)
-                embed.add_field(name="Saldo Restante", value=f"{current_balance - amount:,} moedas", inline=True)
+                embed.add_field(name="Saldo Restante", value=f"{response.get('senderBalance', 0):,} moedas", inline=True)
+            elif status == 400:
+                embed = discord.Embed(
+                    title="❌ Saldo Insuficiente",
+                    description=f"Você não tem moedas suficientes para transferir {amount:,} moedas.",
+                    color=discord.Color.red()
+                )
             else:
                 embed = discord.Embed(
                     title="❌ Falha na Transferência",
@@ -111,7 +95,9 @@ def balance_commands(bot):
             limit = 10
         
         async with aiohttp.ClientSession() as session:
-            status, users = await make_api_request(session, 'GET', f"{CLIENT_API_URL}/client/")
+            status, response = await make_api_request(
+                session, 'GET', f"{BALANCE_API_URL}/balance/leaderboard?limit={limit}"
+            )
             
             if status != 200:
                 embed = discord.Embed(
@@ -122,16 +108,12 @@ def balance_commands(bot):
                 await interaction.followup.send(embed=embed)
                 return
             
-            user_balances = []
-            for user in users:
-                status, balance_data = await make_api_request(
-                    session, 'GET', f"{BALANCE_API_URL}/balance/{user['id']}"
-                )
-                if status == 200:
-                    balance = balance_data.get('balance', 0)
-                    user_balances.append((user, balance))
-            
-            user_balances.sort(key=lambda x: x[1], reverse=True)
+            leaderboard = response.get('leaderboard', [])
+            # balance_api only knows client IDs; names come from client_api
+            clients = await asyncio.gather(*[
+                make_api_request(session, 'GET', f"{CLIENT_API_URL}/client/{entry['user_id']}")
+                for entry in leaderboard
+            ])
             
             embed = discord.Embed(
                 title="🏆 Ranking - Melhores Usuários",
@@ -140,23 +122,25 @@ def balance_commands(bot):
             
             medals = ["🥇", "🥈", "🥉"]
             
-            for i, (user, balance) in enumerate(user_balances[:limit]):
-                rank = i + 1
+            for i, (entry, (client_status, client)) in enumerate(zip(leaderboard, clients)):
+                rank = entry.get('rank', i + 1)
                 medal = medals[i] if i < 3 else f"{rank}."
+                if client_status != 200 or not isinstance(client, dict):
+                    client = {}
                 
                 try:
-                    discord_user = bot.get_user(int(user['discordId']))
-                    display_name = discord_user.display_name if discord_user else user['name']
+                    discord_user = bot.get_user(int(client['discordId']))
+                    display_name = discord_user.display_name if discord_user else client['name']
                 except:
-                    display_name = user['name']
+                    display_name = client.get('name') or "Desconhecido"
                 
                 embed.add_field(
                     name=f"{medal} {display_name}",
-                    value=f"{balance:,} moedas 🪙",
+                    value=f"{entry.get('balance', 0):,} moedas 🪙",
                     inline=True
                 )
             
-            if not user_balances:
+            if not leaderboard:
                 embed.description = "Nenhum usuário encontrado no ranking."
         
         await interaction.followup.send(embed=embed, ephemeral=True)
@@ -177,8 +161,8 @@ def balance_commands(bot):
         user_data = await get_or_create_user(discord_id, interaction.user.display_name)
         
         async with aiohttp.ClientSession() as session:
-            status, operations = await make_api_request(
-                session, 'GET', f"{BALANCE_API_URL}/balance/operations/{user_data['id']}"
+            status, response = await make_api_request(
+                session, 'GET', f"{BALANCE_API_URL}/balance/operations/{user_data['id']}?limit={limit}"
             )
             
             if status != 200:
@@ -190,15 +174,15 @@ def balance_commands(bot):
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
             
+            operations = response.get('operations', [])
+            
             embed = discord.Embed(
                 title="📊 Histórico de Transações",
-                description=f"Últimas {min(len(operations), limit)} transações",
+                description=f"Últimas {len(operations)} transações",
                 color=discord.Color.blue()
             )
             
-            operations.sort(key=lambda x: x.get('createdAt', ''), reverse=True)
-            
-            for operation in operations[:limit]:
+            for operation in operations:
                 amount = operation.get('amount', 0)
                 description = operation.get('description', 'Sem descrição')
                 created_at = operation.get('createdAt', '')
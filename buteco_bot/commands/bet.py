@@ -1,18 +1,64 @@
 from discord import app_commands
 import discord
 import aiohttp
-from tools.utils import make_api_request, get_or_create_user, is_admin, requires_registration
+import asyncio
+import json
+import time
+from typing import Optional
+from tools.utils import make_api_request, make_cached_api_request, get_or_create_user, is_admin, requires_registration
 from tools.constants import BET_API_URL
 
+# Last /bet/events response and its ETag, revalidated with If-None-Match
+active_events_cache = {}
+
+# Live odds embeds: how long to follow an event and how often Discord may be edited
+LIVE_ODDS_MAX_SECONDS = 600
+LIVE_ODDS_EDIT_INTERVAL = 2
+
+OPTION_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+
+def option_emoji(position: int) -> str:
+    return OPTION_EMOJIS[position - 1] if 1 <= position <= len(OPTION_EMOJIS) else f"#{position}"
+
+def option_label(event: dict, position: int) -> str:
+    return next((o['label'] for o in event.get('options', []) if o['option'] == position), f"Opção {position}")
+
+def build_odds_embed(event: dict, odds: dict, live: bool) -> discord.Embed:
+    status_text = {"open": "🟢 Ativa", "finished": "🏁 Finalizada", "cancelled": "❌ Cancelada"}
+    embed = discord.Embed(
+        title=f"📈 {event.get('title', 'Aposta')}",
+        description="Odds ao vivo" if live else "Transmissão encerrada",
+        color=discord.Color.green() if live else discord.Color.greyple()
+    )
+    embed.add_field(name="Status", value=status_text.get(odds.get('status'), "❓ Desconhecido"), inline=True)
+    embed.add_field(name="Pool Total", value=f"{odds.get('totalBetAmount', 0):,} moedas", inline=True)
+    for option in odds.get('options', []):
+        amount = option.get('betAmount', 0)
+        payout = option.get('odds')
+        embed.add_field(
+            name=f"{option_emoji(option['option'])} {option_label(event, option['option'])}",
+            value=f"{amount:,} moedas\nPaga {payout:.2f}x" if payout else f"{amount:,} moedas\nSem apostas",
+            inline=True
+        )
+    if odds.get('winningOption'):
+        embed.add_field(name="🏆 Opção Vencedora", value=option_label(event, odds['winningOption']), inline=False)
+    return embed
+
 def bet_commands(bot):
     @bot.tree.command(name="evento_criar", description="Criar uma nova aposta (Admin)")
     @app_commands.describe(
         title="Título da aposta",
         description="Descrição da aposta",
         option1="Primeira opção para apostar",
-        option2="Segunda opção para apostar"
+        option2="Segunda opção para apostar",
+        option3="Terceira opção (opcional)",
+        option4="Quarta opção (opcional)",
+        option5="Quinta opção (opcional)",
+        option6="Sexta opção (opcional)"
     )
-    async def evento_criar(interaction: discord.Interaction, title: str, description: str, option1: str, option2: str):
+    async def evento_criar(interaction: discord.Interaction, title: str, description: str, option1: str, option2: str,
+                           option3: Optional[str] = None, option4: Optional[str] = None,
+                           option5: Optional[str] = None, option6: Optional[str] = None):
         """Create a new bet (Admin only)."""
         await interaction.response.defer()
         
@@ -43,12 +89,13 @@ def bet_commands(bot):
             await interaction.followup.send(embed=embed)
             return
         
+        options = [option for option in (option1, option2, option3, option4, option5, option6) if option]
+        
         async with aiohttp.ClientSession() as session:
             bet_data = {
                 "title": title,
                 "description": description,
-                "option1": option1,
-                "option2": option2
+                "options": options
             }
             
             status, response = await make_api_request(
@@ -63,14 +110,21 @@ def bet_commands(bot):
                     color=discord.Color.green()
                 )
                 embed.add_field(name="ID da Aposta", value=f"`{event_id}`", inline=False)
-                embed.add_field(name="Opção 1", value=f"🅰️ {option1}", inline=True)
-                embed.add_field(name="Opção 2", value=f"🅱️ {option2}", inline=True)
+                for position, option in enumerate(options, start=1):
+                    embed.add_field(name=f"Opção {position}", value=f"{option_emoji(position)} {option}", inline=True)
                 embed.add_field(
                     name="Como Apostar",
-                    value=f"Use `/bet_place {event_id} 1 [valor]` ou `/bet_place {event_id} 2 [valor]`",
+                    value=f"Use `/evento_apostar {event_id} [número da opção] [valor]`",
                     inline=False
                 )
                 embed.set_footer(text=f"Criado por {interaction.user.display_name}")
+            elif status == 400:
+                error_msg = response if isinstance(response, str) else response.get('detail', 'Erro desconhecido')
+                embed = discord.Embed(
+                    title="❌ Erro ao Criar Aposta",
+                    description=error_msg,
+                    color=discord.Color.red()
+                )
             else:
                 embed = discord.Embed(
                     title="❌ Erro ao Criar Aposta",
@@ -111,8 +165,6 @@ def bet_commands(bot):
             
             event = response.get('event', {})
             total_bets = response.get('totalBets', 0)
-            option1_bets = response.get('option1Bets', 0)
-            option2_bets = response.get('option2Bets', 0)
             
             status_emojis = {
                 True: "🟢 Ativa" if not event.get('isFinished') else "🏁 Finalizada",
@@ -134,27 +186,19 @@ def bet_commands(bot):
             embed.add_field(name="Pool Total", value=f"{event.get('totalBetAmount', 0):,} moedas", inline=True)
             embed.add_field(name="Total de Apostas", value=str(total_bets), inline=True)
             
-            option1_amount = event.get('option1BetAmount', 0)
-            option2_amount = event.get('option2BetAmount', 0)
             total_amount = event.get('totalBetAmount', 0)
             
-            option1_percentage = (option1_amount / total_amount * 100) if total_amount > 0 else 0
-            option2_percentage = (option2_amount / total_amount * 100) if total_amount > 0 else 0
-            
-            embed.add_field(
-                name=f"🅰️ {event.get('option1', 'Opção 1')}",
-                value=f"{option1_amount:,} moedas ({option1_percentage:.1f}%)\n{option1_bets} apostadores",
-                inline=True
-            )
-            
-            embed.add_field(
-                name=f"🅱️ {event.get('option2', 'Opção 2')}",
-                value=f"{option2_amount:,} moedas ({option2_percentage:.1f}%)\n{option2_bets} apostadores",
-                inline=True
-            )
+            for option in event.get('options', []):
+                option_amount = option.get('betAmount', 0)
+                option_percentage = (option_amount / total_amount * 100) if total_amount > 0 else 0
+                embed.add_field(
+                    name=f"{option_emoji(option['option'])} {option['label']}",
+                    value=f"{option_amount:,} moedas ({option_percentage:.1f}%)\n{option.get('bets', 0)} apostadores",
+                    inline=True
+                )
             
             if event.get('isFinished') and event.get('winningOption'):
-                winning_option_name = event.get('option1') if event.get('winningOption') == 1 else event.get('option2')
+                winning_option_name = option_label(event, event['winningOption'])
                 embed.add_field(
                     name="🏆 Opção Vencedora",
                     value=winning_option_name,
@@ -172,8 +216,8 @@ def bet_commands(bot):
         await interaction.response.defer(ephemeral=True)
         
         async with aiohttp.ClientSession() as session:
-            status, response = await make_api_request(
-                session, 'GET', f"{BET_API_URL}/bet/events"
+            status, response = await make_cached_api_request(
+                session, f"{BET_API_URL}/bet/events", active_events_cache
             )
             
             if status != 200:
@@ -201,7 +245,7 @@ def bet_commands(bot):
                 )
                 
                 for event in active_events[:10]:
-                    options_text = f"{event.get('option1', 'Opção 1')} vs {event.get('option2', 'Opção 2')}"
+                    options_text = " vs ".join(option['label'] for option in event.get('options', []))
                     embed.add_field(
                         name=f"🎯 {event['title']}",
                         value=f"**ID:** `{event['id']}`\n**Opções:** {options_text}\n**Pool:** {event.get('totalBetAmount', 0):,} moedas",
@@ -216,7 +260,7 @@ def bet_commands(bot):
     @bot.tree.command(name="evento_apostar", description="Fazer uma aposta")
     @app_commands.describe(
         event_id="ID do evento de aposta",
-        choice="Opção para apostar (1 ou 2)",
+        choice="Número da opção para apostar",
         amount="Quantidade de moedas para apostar"
     )
     @requires_registration()
@@ -224,15 +268,6 @@ def bet_commands(bot):
         """Place a bet on a specific choice."""
         await interaction.response.defer(ephemeral=True)
         
-        if choice not in [1, 2]:
-            embed = discord.Embed(
-                title="❌ Opção Inválida",
-                description="A opção deve ser 1 ou 2.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
-            return
-        
         if amount <= 0:
             embed = discord.Embed(
                 title="❌ Valor Inválido",
@@ -259,6 +294,17 @@ def bet_commands(bot):
                 await interaction.followup.send(embed=embed, ephemeral=True)
                 return
             
+            event_info = event_response.get('event', {})
+            options = event_info.get('options', [])
+            if not any(option['option'] == choice for option in options):
+                embed = discord.Embed(
+                    title="❌ Opção Inválida",
+                    description=f"A opção deve ser um número de 1 a {len(options)}.",
+                    color=discord.Color.red()
+                )
+                await interaction.followup.send(embed=embed, ephemeral=True)
+                return
+            
             bet_data = {
                 "userId": user_data['id'],
                 "betEventId": event_id,
@@ -271,8 +317,7 @@ def bet_commands(bot):
             )
             
             if status == 200:
-                event_info = event_response.get('event', {})
-                choice_name = event_info.get('option1') if choice == 1 else event_info.get('option2')
+                choice_name = option_label(event_info, choice)
                 
                 embed = discord.Embed(
                     title="✅ Aposta Realizada com Sucesso!",
@@ -280,7 +325,7 @@ def bet_commands(bot):
                     color=discord.Color.green()
                 )
                 embed.add_field(name="Aposta", value=event_info.get('title', 'Desconhecida'), inline=False)
-                embed.add_field(name="Sua Escolha", value=f"{'🅰️' if choice == 1 else '🅱️'} {choice_name}", inline=True)
+                embed.add_field(name="Sua Escolha", value=f"{option_emoji(choice)} {choice_name}", inline=True)
             elif status == 400:
                 error_msg = response if isinstance(response, str) else response.get('detail', 'Erro desconhecido')
                 embed = discord.Embed(
@@ -300,7 +345,7 @@ def bet_commands(bot):
     @bot.tree.command(name="evento_finalizar", description="Finalizar uma aposta e distribuir prêmios (Admin)")
     @app_commands.describe(
         event_id="ID do evento de aposta para finalizar",
-        winning_choice="Opção vencedora (1 ou 2)"
+        winning_choice="Número da opção vencedora"
     )
     async def evento_finalizar(interaction: discord.Interaction, event_id: str, winning_choice: int):
         """Finalize a bet and distribute prizes (Admin only)."""
@@ -315,15 +360,6 @@ def bet_commands(bot):
             await interaction.followup.send(embed=embed)
             return
         
-        if winning_choice not in [1, 2]:
-            embed = discord.Embed(
-                title="❌ Opção Inválida",
-                description="A opção vencedora deve ser 1 ou 2.",
-                color=discord.Color.red()
-            )
-            await interaction.followup.send(embed=embed)
-            return
-        
         async with aiohttp.ClientSession() as session:
             status, event_response = await make_api_request(
                 session, 'GET', f"{BET_API_URL}/bet/event/{event_id}"
@@ -338,6 +374,17 @@ def bet_commands(bot):
                 await interaction.followup.send(embed=embed)
                 return
             
+            event_info = event_response.get('event', {})
+            options = event_info.get('options', [])
+            if not any(option['option'] == winning_choice for option in options):
+                embed = discord.Embed(
+                    title="❌ Opção Inválida",
+                    description=f"A opção vencedora deve ser um número de 1 a {len(options)}.",
+                    color=discord.Color.red()
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            
             finalize_data = {
                 "betEventId": event_id,
                 "winningOption": winning_choice
@@ -348,8 +395,7 @@ def bet_commands(bot):
             )
             
             if status == 200:
-                event_info = event_response.get('event', {})
-                choice_name = event_info.get('option1') if winning_choice == 1 else event_info.get('option2')
+                choice_name = option_label(event_info, winning_choice)
                 
                 total_pool = event_info.get('totalBetAmount', 0)
                 
@@ -358,12 +404,16 @@ def bet_commands(bot):
                     description=f"**{event_info.get('title', 'Aposta')}** foi finalizada.",
                     color=discord.Color.gold()
                 )
-                embed.add_field(name="Opção Vencedora", value=f"{'🅰️' if winning_choice == 1 else '🅱️'} {choice_name}", inline=True)
+                embed.add_field(name="Opção Vencedora", value=f"{option_emoji(winning_choice)} {choice_name}", inline=True)
                 embed.add_field(name="Pool Total", value=f"{total_pool:,} moedas", inline=True)
                 
+                job_id = response.get('jobId')
                 embed.add_field(
-                    name="💰 Prêmios Distribuídos",
-                    value="Os prêmios foram distribuídos proporcionalmente entre os vencedores!",
+                    name="💰 Prêmios",
+                    value=(
+                        f"Os prêmios estão sendo distribuídos proporcionalmente entre os vencedores (job `{job_id}`)."
+                        if job_id else "Nenhum vencedor nesta aposta."
+                    ),
                     inline=False
                 )
                     
@@ -463,7 +513,7 @@ def bet_commands(bot):
         
         async with aiohttp.ClientSession() as session:
             status, response = await make_api_request(
-                session, 'GET', f"{BET_API_URL}/bet/user/{user_data['id']}"
+                session, 'GET', f"{BET_API_URL}/bet/user/{user_data['id']}?limit=10"
             )
             
             if status != 200:
@@ -486,11 +536,11 @@ def bet_commands(bot):
             else:
                 embed = discord.Embed(
                     title="🎰 Minhas Apostas",
-                    description=f"Você tem {len(user_bets)} apostas:",
+                    description="Suas apostas mais recentes:",
                     color=discord.Color.blue()
                 )
                 
-                for bet in user_bets[:10]:
+                for bet in user_bets:
                     status_emoji = "🏁" if bet.get('isFinished') else "🟢"
                     result_text = ""
                     
@@ -506,8 +556,64 @@ def bet_commands(bot):
                         inline=False
                     )
                 
-                if len(user_bets) > 10:
-                    embed.set_footer(text=f"Mostrando 10 de {len(user_bets)} apostas")
+                if response.get('nextCursor'):
+                    embed.set_footer(text=f"Mostrando as {len(user_bets)} apostas mais recentes")
         
         await interaction.followup.send(embed=embed, ephemeral=True)
 
+    @bot.tree.command(name="evento_ao_vivo", description="Acompanhar as odds de uma aposta ao vivo")
+    @app_commands.describe(event_id="ID do evento de aposta para acompanhar")
+    @requires_registration()
+    async def evento_ao_vivo(interaction: discord.Interaction, event_id: str):
+        """Keep one embed updated with the event's pool and odds."""
+        await interaction.response.defer()
+        
+        timeout = aiohttp.ClientTimeout(total=LIVE_ODDS_MAX_SECONDS, sock_read=None)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            status, response = await make_api_request(
+                session, 'GET', f"{BET_API_URL}/bet/event/{event_id}"
+            )
+            
+            if status != 200:
+                embed = discord.Embed(
+                    title="❌ Aposta Não Encontrada" if status == 404 else "❌ Erro",
+                    description=f"Não foi possível encontrar a aposta com ID `{event_id}`." if status == 404 else "Falha ao obter informações da aposta.",
+                    color=discord.Color.red()
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            
+            event = response.get('event', {})
+            total_amount = event.get('totalBetAmount', 0)
+            odds = {
+                "status": "open",
+                "totalBetAmount": total_amount,
+                "options": [
+                    {
+                        "option": option['option'],
+                        "betAmount": option['betAmount'],
+                        "odds": total_amount / option['betAmount'] if option['betAmount'] else None
+                    }
+                    for option in event.get('options', [])
+                ]
+            }
+            message = await interaction.followup.send(embed=build_odds_embed(event, odds, live=True), wait=True)
+            last_edit = time.monotonic()
+            stale = False
+            
+            try:
+                async with session.get(f"{BET_API_URL}/bet/event/{event_id}/odds") as stream:
+                    async for line in stream.content:
+                        line = line.decode().strip()
+                        if line.startswith("data:"):
+                            odds = json.loads(line[5:])
+                            stale = True
+                        # Discord rate-limits edits: hold back updates (keepalives flush them later)
+                        if stale and (odds.get('status') != 'open' or time.monotonic() - last_edit >= LIVE_ODDS_EDIT_INTERVAL):
+                            await message.edit(embed=build_odds_embed(event, odds, live=odds.get('status') == 'open'))
+                            last_edit = time.monotonic()
+                            stale = False
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+        
+        await message.edit(embed=build_odds_embed(event, odds, live=False))
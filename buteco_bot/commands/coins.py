@@ -1,8 +1,10 @@
 import discord
 from discord import app_commands
-from tools.utils import get_or_create_user, make_api_request, requires_registration
+from tools.utils import get_or_create_user, make_api_request, requires_registration, is_admin
 from tools.constants import BALANCE_API_URL, COIN_API_URL
 import aiohttp
+import hashlib
+from datetime import date
 
 from typing import Optional
 
@@ -66,6 +68,13 @@ def coins_commands(bot):
                     description=f"Você recebeu **{amount:,} moedas**! 🪙",
                     color=discord.Color.gold()
                 )
+                streak = response.get('streak', 0)
+                if streak > 1:
+                    embed.add_field(
+                        name="🔥 Sequência",
+                        value=f"{streak} dias seguidos!",
+                        inline=False
+                    )
                 embed.add_field(
                     name="Próxima Coleta",
                     value="Volte amanhã para mais moedas!",
@@ -147,3 +156,59 @@ def coins_commands(bot):
         
         await interaction.followup.send(embed=embed, ephemeral=True)
 
+    @bot.tree.command(name="airdrop", description="Distribua moedas para todos os usuários registrados (Admin)")
+    @app_commands.describe(
+        amount="Quantidade de moedas para cada usuário",
+        description="Descrição do airdrop (opcional)"
+    )
+    async def airdrop(interaction: discord.Interaction, amount: int, description: Optional[str] = None):
+        """Credit coins to every registered user (Admin only)."""
+        await interaction.response.defer()
+        
+        if not is_admin(interaction.user):
+            embed = discord.Embed(
+                title="❌ Permissão Negada",
+                description="Apenas administradores podem fazer airdrops.",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=embed)
+            return
+        
+        if amount <= 0:
+            embed = discord.Embed(
+                title="❌ Valor Inválido",
+                description="O valor do airdrop deve ser positivo.",
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=embed)
+            return
+        
+        async with aiohttp.ClientSession() as session:
+            # Named after its inputs and the day, so rerunning the same command resumes the
+            # airdrop instead of paying everyone again; change the description to send another
+            description = description or f"Airdrop de {interaction.user.display_name}"
+            description_hash = hashlib.sha256(description.encode()).hexdigest()[:12]
+            airdrop_data = {
+                "airdropId": f"discord-{date.today().isoformat()}-{amount}-{description_hash}",
+                "amount": amount,
+                "description": description,
+                "allClients": True
+            }
+            status, response = await make_api_request(
+                session, 'POST', f"{COIN_API_URL}/airdrop", airdrop_data
+            )
+            
+            if status == 200:
+                embed = discord.Embed(
+                    title="🪂 Airdrop Concluído!",
+                    description=f"**{response.get('granted', 0):,}** usuários receberam **{amount:,} moedas** cada! 🪙",
+                    color=discord.Color.gold()
+                )
+            else:
+                embed = discord.Embed(
+                    title="❌ Erro",
+                    description="Falha ao concluir o airdrop. Repita o mesmo comando para retomá-lo sem pagar ninguém duas vezes.",
+                    color=discord.Color.red()
+                )
+        
+        await interaction.followup.send(embed=embed)
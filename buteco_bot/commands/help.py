@@ -81,11 +81,13 @@ def help_commands(bot):
             ("💰 **Comandos de Economia**", ""),
             ("/daily", "Colete suas moedas diárias (uma vez por dia)"),
             ("/transfer <usuário> <valor> [descrição]", "Transfira moedas para outro usuário"),
+            ("/airdrop <valor> [descrição]", "Distribuir moedas para todos os usuários (Admin)"),
             ("", ""),
             ("🎰 **Comandos de Apostas**", ""),
-            ("/bet_create <título> <descrição> <opção1> <opção2>", "Criar nova aposta (Admin)"),
+            ("/bet_create <título> <descrição> <opção1> <opção2> [opção3-6]", "Criar nova aposta com 2 a 6 opções (Admin)"),
             ("/bet_list", "Listar apostas ativas"),
             ("/bet_info <event_id>", "Ver detalhes de uma aposta"),
+            ("/evento_ao_vivo <event_id>", "Acompanhar as odds de uma aposta ao vivo"),
             ("/bet_place <event_id> <opção> <valor>", "Fazer uma aposta"),
             ("/bet_finalize <event_id> <opção_vencedora>", "Finalizar aposta (Admin)"),
             ("/bet_cancel <event_id>", "Cancelar aposta e reembolsar (Admin)"),
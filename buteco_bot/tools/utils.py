@@ -25,6 +25,25 @@ async def make_api_request(session: aiohttp.ClientSession, method: str, url: str
         logger.error(f"API request failed: {e}")
         return None, str(e)
 
+async def make_cached_api_request(session: aiohttp.ClientSession, url: str, cache: dict):
+    """GET with If-None-Match; a 304 is answered from the cached body (cache holds 'etag' and 'data')."""
+    headers = {"If-None-Match": cache["etag"]} if cache.get("etag") else {}
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return 200, cache["data"]
+            if response.content_type == 'application/json':
+                data = await response.json()
+            else:
+                data = await response.text()
+            if response.status == 200 and response.headers.get("ETag"):
+                cache["etag"] = response.headers["ETag"]
+                cache["data"] = data
+            return response.status, data
+    except aiohttp.ClientError as e:
+        logger.error(f"API request failed: {e}")
+        return None, str(e)
+
 async def get_or_create_user(discord_id: str, username: str) -> Optional[dict]:
     """Get existing user or create new one."""
     async with aiohttp.ClientSession() as session:
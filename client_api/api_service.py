@@ -1,10 +1,11 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import os
 import logging
+import httpx
 from models.User import User
 from models.UserCreate import UserCreate
 from models.UserUpdate import UserUpdate
@@ -18,13 +19,23 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+COIN_API_URL = os.getenv("COIN_API_URL")
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 app = FastAPI()
 
+def invalidate_coin_api_client(client_id: str):
+    """Drop coin_api's cached existence check so it re-asks after a client is created or deleted"""
+    if not COIN_API_URL:
+        return
+    try:
+        httpx.delete(f"{COIN_API_URL}/daily-coins/client-cache/{client_id}", timeout=2)
+    except httpx.HTTPError as e:
+        logger.warning(f"Failed to invalidate coin_api client cache for {client_id}: {e}")
+
 @app.post("/client/")
-def register_client(user: UserCreate):
+def register_client(user: UserCreate, background_tasks: BackgroundTasks):
     logger.info(f"Attempting to register new client with discordId: {user.discordId}")
     db: Session = SessionLocal()
     try:
@@ -42,6 +53,7 @@ def register_client(user: UserCreate):
         db.add(new_user)
         db.commit()
         db.refresh(new_user)
+        background_tasks.add_task(invalidate_coin_api_client, str(new_user.id))
         logger.info(f"Successfully registered new client: {new_user.id} ({user.discordId})")
         return new_user
     finally:
@@ -110,7 +122,7 @@ def update_client(id: str, user: UserUpdate):
         db.close()
 
 @app.delete("/client/{id}")
-def delete_client(id: str):
+def delete_client(id: str, background_tasks: BackgroundTasks):
     logger.info(f"Deleting client: {id}")
     db: Session = SessionLocal()
     try:
@@ -120,6 +132,7 @@ def delete_client(id: str):
             raise HTTPException(status_code=404, detail="User not found")
         db.delete(user)
         db.commit()
+        background_tasks.add_task(invalidate_coin_api_client, id)
         logger.info(f"Successfully deleted client: {id}")
         return {"detail": "User deleted"}
     finally:
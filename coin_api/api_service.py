@@ -1,16 +1,23 @@
 from fastapi import FastAPI, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import select, update, func, case, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from dotenv import load_dotenv
+import asyncio
 import os
-import requests
 import logging
 import uuid
-from datetime import date, timedelta
-from models.DailyClaim import DailyClaim, Base
+import hashlib
+from datetime import date, datetime, timedelta
+from models.DailyClaim import DailyClaim
+from models.DailyClaimStats import DailyClaimStats
 from models.DailyClaimRequest import DailyClaimRequest
-from sqlalchemy import func
+from models.DailyClaimStatusRequest import DailyClaimStatusRequest
+from models.Airdrop import Airdrop
+from models.AirdropGrant import AirdropGrant
+from models.AirdropRequest import AirdropRequest
+from service_client import ServiceClient, ServiceUnavailable
+from client_cache import ClientCache
 
 load_dotenv()
 
@@ -24,24 +31,137 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 BALANCE_API_URL = os.getenv("BALANCE_API_URL")
 CLIENT_API_URL = os.getenv("CLIENT_API_URL")
 DAILY_COINS_AMOUNT = int(os.getenv("DAILY_COINS_AMOUNT", 100))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+BALANCE_API_TIMEOUT = float(os.getenv("BALANCE_API_TIMEOUT", 5))
+BALANCE_API_RETRIES = int(os.getenv("BALANCE_API_RETRIES", 3))
+BALANCE_API_MAX_CONNECTIONS = int(os.getenv("BALANCE_API_MAX_CONNECTIONS", 50))
+BALANCE_API_MAX_CONCURRENCY = int(os.getenv("BALANCE_API_MAX_CONCURRENCY", 50))
+CLIENT_API_TIMEOUT = float(os.getenv("CLIENT_API_TIMEOUT", 3))
+CLIENT_API_MAX_CONNECTIONS = int(os.getenv("CLIENT_API_MAX_CONNECTIONS", 20))
+CLIENT_API_MAX_CONCURRENCY = int(os.getenv("CLIENT_API_MAX_CONCURRENCY", 20))
+CLIENT_CACHE_SIZE = int(os.getenv("CLIENT_CACHE_SIZE", 50000))
+CLIENT_CACHE_TTL = float(os.getenv("CLIENT_CACHE_TTL", 172800))
+CLIENT_CACHE_NEGATIVE_TTL = float(os.getenv("CLIENT_CACHE_NEGATIVE_TTL", 60))
+AIRDROP_CHUNK_SIZE = int(os.getenv("AIRDROP_CHUNK_SIZE", 500))
+MAX_STATUS_BATCH_SIZE = int(os.getenv("MAX_STATUS_BATCH_SIZE", 1000))
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def async_database_url(url: str) -> str:
+    """Point a plain postgresql:// URL at the asyncpg driver."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
 
-Base.metadata.create_all(bind=engine)
+engine = create_async_engine(
+    async_database_url(DATABASE_URL),
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True
+)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+balance_api = ServiceClient(
+    "balance-api",
+    BALANCE_API_URL,
+    timeout=BALANCE_API_TIMEOUT,
+    max_connections=BALANCE_API_MAX_CONNECTIONS,
+    max_concurrency=BALANCE_API_MAX_CONCURRENCY,
+    retries=BALANCE_API_RETRIES
+)
+client_api = ServiceClient(
+    "client-api",
+    CLIENT_API_URL,
+    timeout=CLIENT_API_TIMEOUT,
+    max_connections=CLIENT_API_MAX_CONNECTIONS,
+    max_concurrency=CLIENT_API_MAX_CONCURRENCY
+)
+
+client_cache = ClientCache(
+    max_size=CLIENT_CACHE_SIZE,
+    ttl=CLIENT_CACHE_TTL,
+    negative_ttl=CLIENT_CACHE_NEGATIVE_TTL
+)
 
 app = FastAPI()
 
+@app.on_event("startup")
+async def startup():
+    await balance_api.start()
+    await client_api.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await balance_api.close()
+    await client_api.close()
+
+async def client_exists(client_id: str) -> bool:
+    """Ask client_api whether the client exists, answering from client_cache when possible"""
+    exists = client_cache.get(client_id)
+    if exists is not None:
+        return exists
+    try:
+        client_response = await client_api.get(f"/client/{client_id}")
+    except ServiceUnavailable:
+        logger.error(f"Client service unavailable while checking client: {client_id}")
+        raise HTTPException(status_code=503, detail="Client service unavailable")
+    if client_response.status_code == 404:
+        client_cache.set(client_id, False)
+        return False
+    if client_response.status_code != 200:
+        # Unknown is not "exists": don't credit or cache on an answer we can't trust
+        logger.error(f"Client service returned {client_response.status_code} while checking client: {client_id}")
+        raise HTTPException(status_code=503, detail="Client service unavailable")
+    client_cache.set(client_id, True)
+    return True
+
+def record_claim_stats(client_id: str, claim_date: date, amount: int):
+    """Upsert the client's running stats for a new claim; the streak grows only if yesterday was claimed."""
+    continues_streak = DailyClaimStats.lastClaimDate == claim_date - timedelta(days=1)
+    streak = DailyClaimStats.currentStreak + 1
+    return pg_insert(DailyClaimStats).values(
+        clientId=client_id,
+        totalClaims=1,
+        totalCoinsEarned=amount,
+        currentStreak=1,
+        bestStreak=1,
+        lastClaimDate=claim_date
+    ).on_conflict_do_update(
+        index_elements=[DailyClaimStats.clientId],
+        set_={
+            "totalClaims": DailyClaimStats.totalClaims + 1,
+            "totalCoinsEarned": DailyClaimStats.totalCoinsEarned + amount,
+            "currentStreak": case((continues_streak, streak), else_=1),
+            "bestStreak": case(
+                (and_(continues_streak, streak > DailyClaimStats.bestStreak), streak),
+                else_=DailyClaimStats.bestStreak
+            ),
+            "lastClaimDate": claim_date,
+            "updatedAt": datetime.utcnow()
+        }
+    ).returning(DailyClaimStats.currentStreak)
+
+def current_streak(stats: DailyClaimStats, today: date) -> int:
+    """A streak is still alive if the last claim was today or yesterday."""
+    if stats.lastClaimDate is None or stats.lastClaimDate < today - timedelta(days=1):
+        return 0
+    return stats.currentStreak
+
 @app.post("/daily-coins")
-def claim_daily_coins(request: DailyClaimRequest):
+async def claim_daily_coins(request: DailyClaimRequest):
     logger.info(f"Daily coin claim attempt by client: {request.clientId}")
-    db: Session = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
         today = date.today()
-        existing_claim = db.query(DailyClaim).filter(
+        # Cheap indexed read so repeat claimers never reach client_api or balance_api
+        result = await db.execute(select(DailyClaim.id).where(
             DailyClaim.clientId == request.clientId,
-            func.date(DailyClaim.createdAt) == today
-        ).first()
+            DailyClaim.claimDate == today
+        ))
+        existing_claim = result.first()
         
         if existing_claim:
             logger.warning(f"Daily coins already claimed today by client: {request.clientId}")
@@ -50,23 +170,19 @@ def claim_daily_coins(request: DailyClaimRequest):
                 detail="Daily coins already claimed today. Come back tomorrow!"
             )
         
-        try:
-            client_response = requests.get(f"{CLIENT_API_URL}/client/{request.clientId}")
-            if client_response.status_code == 404:
-                logger.warning(f"Daily coin claim failed - client not found: {request.clientId}")
-                raise HTTPException(status_code=404, detail="Client not found")
-        except requests.exceptions.RequestException:
-            logger.error(f"Client service unavailable during daily coin claim for: {request.clientId}")
-            raise HTTPException(status_code=503, detail="Client service unavailable")
+        if not await client_exists(request.clientId):
+            logger.warning(f"Daily coin claim failed - client not found: {request.clientId}")
+            raise HTTPException(status_code=404, detail="Client not found")
         
         try:
-            add_balance_response = requests.post(
-                f"{BALANCE_API_URL}/balance/add",
-                json={
+            add_balance_response = await balance_api.post(
+                "/balance/add",
+                {
                     "clientId": request.clientId,
                     "amount": DAILY_COINS_AMOUNT,
                     "description": "Daily coins reward"
-                }
+                },
+                idempotency_key=f"daily-claim:{request.clientId}:{today.isoformat()}"
             )
             
             if add_balance_response.status_code != 200:
@@ -76,20 +192,32 @@ def claim_daily_coins(request: DailyClaimRequest):
             balance_response_data = add_balance_response.json()
             balance_operation_id = balance_response_data.get('id', str(uuid.uuid4()))
                 
-        except requests.exceptions.RequestException:
+        except ServiceUnavailable:
             logger.error(f"Balance service unavailable during daily coin claim for: {request.clientId}")
             raise HTTPException(status_code=503, detail="Balance service unavailable")
         
-        daily_claim = DailyClaim(
+        # The unique (clientId, claimDate) index settles concurrent claims: the loser's
+        # credit was a replay of the same idempotency key, and its insert is skipped here
+        result = await db.execute(pg_insert(DailyClaim).values(
             clientId=request.clientId,
+            claimDate=today,
             balanceOperationId=balance_operation_id,
             amount=DAILY_COINS_AMOUNT,
             description="Daily coins reward"
-        )
-        
-        db.add(daily_claim)
-        db.commit()
-        db.refresh(daily_claim)
+        ).on_conflict_do_nothing(
+            index_elements=[DailyClaim.clientId, DailyClaim.claimDate]
+        ).returning(DailyClaim.id))
+        if result.first() is None:
+            await db.rollback()
+            logger.warning(f"Daily coins already claimed today by client: {request.clientId}")
+            raise HTTPException(
+                status_code=400,
+                detail="Daily coins already claimed today. Come back tomorrow!"
+            )
+        # Same transaction as the claim row, so stats count each claim exactly once
+        result = await db.execute(record_claim_stats(request.clientId, today, DAILY_COINS_AMOUNT))
+        streak = result.scalar_one()
+        await db.commit()
         
         logger.info(f"Successfully processed daily coin claim for client {request.clientId}: +{DAILY_COINS_AMOUNT} coins")
         
@@ -98,61 +226,97 @@ def claim_daily_coins(request: DailyClaimRequest):
             "amount": DAILY_COINS_AMOUNT,
             "clientId": request.clientId,
             "claimDate": today.isoformat(),
+            "streak": streak,
             "balanceOperationId": balance_operation_id
         }
         
     finally:
-        db.close()
+        await db.close()
 
 @app.get("/daily-coins/history/{client_id}")
-def get_claim_history(client_id: str, limit: int = 30):
+async def get_claim_history(client_id: str, limit: int = 30):
     logger.info(f"Getting daily coin claim history for client: {client_id} (limit: {limit})")
-    db: Session = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
-        claims = db.query(DailyClaim).filter(
+        result = await db.execute(select(DailyClaim).where(
             DailyClaim.clientId == client_id
-        ).order_by(DailyClaim.createdAt.desc()).limit(limit).all()
+        ).order_by(DailyClaim.claimDate.desc()).limit(limit))
+        claims = result.scalars().all()
         
         history = []
-        total_earned = 0
         for claim in claims:
-            claim_amount = claim.amount
-            total_earned += claim_amount
             history.append({
-                "claimDate": claim.createdAt.date().isoformat(),
-                "amount": claim_amount,
+                "claimDate": claim.claimDate.isoformat(),
+                "amount": claim.amount,
                 "description": claim.description,
                 "createdAt": claim.createdAt.isoformat()
             })
         
+        # Lifetime totals come from the stats row, not from the limited page above
+        stats = await db.get(DailyClaimStats, client_id)
+        
         logger.info(f"Retrieved {len(history)} claim records for client: {client_id}")
         return {
             "clientId": client_id,
-            "totalClaims": len(claims),
-            "totalCoinsEarned": total_earned,
+            "totalClaims": stats.totalClaims if stats else 0,
+            "totalCoinsEarned": stats.totalCoinsEarned if stats else 0,
             "history": history
         }
         
     finally:
-        db.close()
+        await db.close()
+
+@app.get("/daily-coins/stats/{client_id}")
+async def get_claim_stats(client_id: str):
+    logger.info(f"Getting daily coin claim stats for client: {client_id}")
+    db: AsyncSession = SessionLocal()
+    try:
+        stats = await db.get(DailyClaimStats, client_id)
+        if stats is None:
+            return {
+                "clientId": client_id,
+                "totalClaims": 0,
+                "totalCoinsEarned": 0,
+                "currentStreak": 0,
+                "bestStreak": 0,
+                "lastClaimDate": None
+            }
+        return {
+            "clientId": client_id,
+            "totalClaims": stats.totalClaims,
+            "totalCoinsEarned": stats.totalCoinsEarned,
+            "currentStreak": current_streak(stats, date.today()),
+            "bestStreak": stats.bestStreak,
+            "lastClaimDate": stats.lastClaimDate.isoformat() if stats.lastClaimDate else None
+        }
+        
+    finally:
+        await db.close()
+
+@app.delete("/daily-coins/client-cache/{client_id}")
+async def invalidate_client_cache(client_id: str):
+    """Forget the cached existence check for a client; client_api calls this on deletion"""
+    client_cache.invalidate(client_id)
+    logger.info(f"Invalidated cached client: {client_id}")
+    return {"detail": "Client cache entry removed"}
 
 @app.get("/health")
-def health_check():
+async def health_check():
     logger.info("Health check requested")
     return {"status": "healthy", "service": "coins-api"}
 
 @app.get("/daily-coins/status/{client_id}")
-def get_claim_status(client_id: str):
+async def get_claim_status(client_id: str):
     """Check if user can claim daily coins today."""
     logger.info(f"Checking daily coin claim status for client: {client_id}")
-    db: Session = SessionLocal()
+    db: AsyncSession = SessionLocal()
     try:
         today = date.today()
-        from sqlalchemy import func
-        existing_claim = db.query(DailyClaim).filter(
+        result = await db.execute(select(DailyClaim).where(
             DailyClaim.clientId == client_id,
-            func.date(DailyClaim.createdAt) == today
-        ).first()
+            DailyClaim.claimDate == today
+        ))
+        existing_claim = result.scalars().first()
         
         can_claim = existing_claim is None
         next_claim_date = (today + timedelta(days=1)).isoformat() if not can_claim else today.isoformat()
@@ -160,10 +324,224 @@ def get_claim_status(client_id: str):
         return {
             "clientId": client_id,
             "canClaim": can_claim,
-            "lastClaimDate": existing_claim.createdAt.date().isoformat() if existing_claim else None,
+            "lastClaimDate": existing_claim.claimDate.isoformat() if existing_claim else None,
             "nextClaimDate": next_claim_date,
             "dailyAmount": DAILY_COINS_AMOUNT
         }
         
     finally:
-        db.close()
+        await db.close()
+
+@app.post("/daily-coins/status")
+async def get_claim_statuses(request: DailyClaimStatusRequest):
+    """Claim status for many clients, read from the (clientId, claimDate) index in one query."""
+    try:
+        # Canonical form, so lookups match the UUIDs the database hands back
+        client_ids = list(dict.fromkeys(str(uuid.UUID(client_id)) for client_id in request.clientIds))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="clientIds must be valid UUIDs")
+    logger.info(f"Checking daily coin claim status for {len(client_ids)} clients")
+    if len(client_ids) > MAX_STATUS_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_STATUS_BATCH_SIZE} clients can be checked at once"
+        )
+    
+    db: AsyncSession = SessionLocal()
+    try:
+        today = date.today()
+        last_claims = {}
+        if client_ids:
+            result = await db.execute(select(
+                DailyClaim.clientId,
+                func.max(DailyClaim.claimDate)
+            ).where(
+                DailyClaim.clientId.in_(client_ids)
+            ).group_by(DailyClaim.clientId))
+            last_claims = {str(client_id): last_claim_date for client_id, last_claim_date in result.all()}
+        
+        tomorrow = (today + timedelta(days=1)).isoformat()
+        statuses = []
+        for client_id in client_ids:
+            last_claim_date = last_claims.get(client_id)
+            can_claim = last_claim_date != today
+            statuses.append({
+                "clientId": client_id,
+                "canClaim": can_claim,
+                "lastClaimDate": last_claim_date.isoformat() if last_claim_date else None,
+                "nextClaimDate": today.isoformat() if can_claim else tomorrow
+            })
+        
+        return {
+            "date": today.isoformat(),
+            "dailyAmount": DAILY_COINS_AMOUNT,
+            "canClaimCount": sum(1 for status in statuses if status["canClaim"]),
+            "statuses": statuses
+        }
+        
+    finally:
+        await db.close()
+
+def serialize_airdrop(airdrop: Airdrop) -> dict:
+    return {
+        "airdropId": airdrop.id,
+        "amount": airdrop.amount,
+        "description": airdrop.description,
+        "status": airdrop.status,
+        "recipients": airdrop.recipients,
+        "granted": airdrop.granted,
+        "createdAt": airdrop.createdAt.isoformat(),
+        "finishedAt": airdrop.finishedAt.isoformat() if airdrop.finishedAt else None
+    }
+
+def airdrop_recipients_hash(request: AirdropRequest) -> str:
+    """Fingerprint of who an airdrop was meant for, so a rerun can't widen it."""
+    selection = "all-clients" if request.allClients else "\n".join(sorted(set(request.clientIds)))
+    return hashlib.sha256(selection.encode()).hexdigest()
+
+@app.post("/airdrop")
+async def create_airdrop(request: AirdropRequest):
+    """Credit the same amount to many clients, one balance batch and one grant insert per chunk.
+    
+    Rerunning an airdropId only credits clients without a grant row yet, and the
+    per-client operationKey makes balance_api skip credits it already applied.
+    """
+    logger.info(f"Airdrop {request.airdropId} requested: {request.amount} coins (allClients: {request.allClients})")
+    if not request.airdropId.strip():
+        raise HTTPException(status_code=400, detail="Airdrop ID is required")
+    if request.amount <= 0:
+        raise HTTPException(status_code=400, detail="Airdrop amount must be positive")
+    if request.allClients == bool(request.clientIds):
+        raise HTTPException(status_code=400, detail="Provide either clientIds or allClients")
+    
+    if request.allClients:
+        try:
+            clients_response = await client_api.get("/client/")
+        except ServiceUnavailable:
+            logger.error(f"Client service unavailable while loading clients for airdrop: {request.airdropId}")
+            raise HTTPException(status_code=503, detail="Client service unavailable")
+        if clients_response.status_code != 200:
+            logger.error(f"Failed to load clients for airdrop {request.airdropId}: {clients_response.status_code}")
+            raise HTTPException(status_code=500, detail="Failed to load registered clients")
+        recipients = [client["id"] for client in clients_response.json()]
+        unknown_client_ids = []
+    else:
+        # Only the requested IDs are checked, mostly answered from client_cache
+        requested = list(dict.fromkeys(request.clientIds))
+        exists = await asyncio.gather(*(client_exists(client_id) for client_id in requested))
+        recipients = [client_id for client_id, found in zip(requested, exists) if found]
+        unknown_client_ids = [client_id for client_id, found in zip(requested, exists) if not found]
+    
+    description = request.description or f"Airdrop {request.airdropId}"
+    recipients_hash = airdrop_recipients_hash(request)
+    
+    db: AsyncSession = SessionLocal()
+    try:
+        await db.execute(pg_insert(Airdrop).values(
+            id=request.airdropId,
+            amount=request.amount,
+            description=description,
+            status="running",
+            recipients=len(recipients),
+            recipientsHash=recipients_hash
+        ).on_conflict_do_nothing(index_elements=[Airdrop.id]))
+        result = await db.execute(select(Airdrop).where(Airdrop.id == request.airdropId))
+        airdrop = result.scalar_one()
+        if airdrop.amount != request.amount or airdrop.recipientsHash != recipients_hash:
+            logger.warning(f"Airdrop {request.airdropId} already exists with a different amount or recipient selection")
+            await db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="Airdrop ID already used with a different amount or recipients"
+            )
+        await db.commit()
+        
+        result = await db.execute(select(AirdropGrant.clientId).where(
+            AirdropGrant.airdropId == request.airdropId
+        ))
+        already_granted = set(result.scalars().all())
+        pending = [client_id for client_id in recipients if client_id not in already_granted]
+        
+        granted = 0
+        for start in range(0, len(pending), AIRDROP_CHUNK_SIZE):
+            chunk = pending[start:start + AIRDROP_CHUNK_SIZE]
+            try:
+                batch_response = await balance_api.post(
+                    "/balance/batch",
+                    [
+                        {
+                            "clientId": client_id,
+                            "amount": airdrop.amount,
+                            "description": airdrop.description,
+                            "operationKey": f"airdrop:{airdrop.id}:{client_id}"
+                        }
+                        for client_id in chunk
+                    ],
+                    retry=True
+                )
+            except ServiceUnavailable:
+                logger.error(f"Balance service unavailable during airdrop {airdrop.id} after {granted} grants")
+                raise HTTPException(status_code=503, detail="Balance service unavailable; rerun the airdrop to resume")
+            if batch_response.status_code != 200:
+                logger.error(f"Failed to credit airdrop {airdrop.id} chunk: {batch_response.status_code}")
+                raise HTTPException(status_code=500, detail="Failed to add coins to balance")
+            
+            operation_ids = {op["clientId"]: op["id"] for op in batch_response.json()["operations"]}
+            now = datetime.utcnow()
+            result = await db.execute(
+                pg_insert(AirdropGrant).on_conflict_do_nothing(
+                    index_elements=[AirdropGrant.airdropId, AirdropGrant.clientId]
+                ).returning(AirdropGrant.id),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "airdropId": airdrop.id,
+                        "clientId": client_id,
+                        "amount": airdrop.amount,
+                        "balanceOperationId": operation_ids.get(client_id),
+                        "createdAt": now,
+                        "updatedAt": now
+                    }
+                    for client_id in chunk
+                ]
+            )
+            inserted = len(result.all())
+            await db.execute(update(Airdrop).where(Airdrop.id == airdrop.id).values(
+                granted=Airdrop.granted + inserted
+            ))
+            await db.commit()
+            granted += inserted
+            logger.info(f"Airdrop {airdrop.id}: credited chunk of {len(chunk)} ({granted}/{len(pending)})")
+        
+        await db.execute(update(Airdrop).where(Airdrop.id == airdrop.id).values(
+            status="completed",
+            recipients=len(already_granted.union(recipients)),
+            finishedAt=datetime.utcnow()
+        ))
+        await db.commit()
+        result = await db.execute(select(Airdrop).where(Airdrop.id == airdrop.id))
+        airdrop = result.scalar_one()
+        
+        logger.info(f"Airdrop {airdrop.id} completed: {granted} new grants, {len(recipients) - len(pending)} already granted")
+        return {
+            **serialize_airdrop(airdrop),
+            "grantedThisRun": granted,
+            "alreadyGranted": len(recipients) - len(pending),
+            "unknownClientIds": unknown_client_ids
+        }
+        
+    finally:
+        await db.close()
+
+@app.get("/airdrop/{airdrop_id}")
+async def get_airdrop(airdrop_id: str):
+    db: AsyncSession = SessionLocal()
+    try:
+        result = await db.execute(select(Airdrop).where(Airdrop.id == airdrop_id))
+        airdrop = result.scalar_one_or_none()
+        if airdrop is None:
+            raise HTTPException(status_code=404, detail="Airdrop not found")
+        return serialize_airdrop(airdrop)
+        
+    finally:
+        await db.close()
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+from typing import Optional
+import time
+
+class ClientCache:
+    """Bounded LRU of client-existence answers from client_api.
+
+    Found clients are remembered for ttl and missing ones (404) for the shorter
+    negative_ttl. The least recently used entry is dropped once max_size is
+    reached. client_api calls invalidate() (through the DELETE endpoint) when a
+    client is deleted, so ttl only bounds staleness in other coin_api processes.
+    """
+
+    def __init__(self, max_size: int = 50000, ttl: float = 172800.0, negative_ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, client_id: str) -> Optional[bool]:
+        """True if the client exists, False if it is known missing, None if unknown."""
+        entry = self.entries.get(client_id)
+        if entry is None:
+            return None
+        exists, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self.entries[client_id]
+            return None
+        self.entries.move_to_end(client_id)
+        return exists
+
+    def set(self, client_id: str, exists: bool) -> None:
+        ttl = self.ttl if exists else self.negative_ttl
+        self.entries[client_id] = (exists, time.monotonic() + ttl)
+        self.entries.move_to_end(client_id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, client_id: str) -> None:
+        self.entries.pop(client_id, None)
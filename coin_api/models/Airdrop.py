@@ -0,0 +1,23 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, Integer, Text
+from datetime import datetime
+
+Base = declarative_base()
+
+class Airdrop(Base):
+    __tablename__ = "airdrop"
+    
+    id = Column(String, primary_key=True)  # chosen by the caller, so reruns hit the same row
+    amount = Column(Integer, nullable=False)
+    description = Column(Text, nullable=False)
+    status = Column(String, default="running", nullable=False)  # running, completed
+    recipients = Column(Integer, default=0, nullable=False)
+    recipientsHash = Column(String, nullable=False)  # sha256 of the requested recipient selection
+    granted = Column(Integer, default=0, nullable=False)
+    finishedAt = Column(DateTime, nullable=True)
+    createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return (f"Airdrop(id={self.id}, amount={self.amount}, status={self.status}, "
+                f"recipients={self.recipients}, granted={self.granted})")
@@ -0,0 +1,23 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from datetime import datetime
+
+Base = declarative_base()
+
+class AirdropGrant(Base):
+    __tablename__ = "airdrop_grant"
+    __table_args__ = (UniqueConstraint("airdropId", "clientId", name="UQ_airdrop_grant_airdrop_client"),)
+    
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    airdropId = Column(String, nullable=False)
+    clientId = Column(UUID(as_uuid=False), nullable=False)
+    amount = Column(Integer, nullable=False)
+    balanceOperationId = Column(UUID(as_uuid=False), nullable=True)
+    createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return (f"AirdropGrant(id={self.id}, airdropId={self.airdropId}, clientId={self.clientId}, "
+                f"amount={self.amount}, balanceOperationId={self.balanceOperationId})")
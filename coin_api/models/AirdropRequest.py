@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class AirdropRequest(BaseModel):
+    airdropId: str  # reuse the same ID to rerun safely
+    amount: int
+    description: Optional[str] = None
+    clientIds: Optional[List[str]] = None
+    allClients: bool = False
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, String, DateTime, Integer, Text
+from sqlalchemy import Column, Date, DateTime, Integer, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from datetime import datetime
 
@@ -7,17 +8,19 @@ Base = declarative_base()
 
 class DailyClaim(Base):
     __tablename__ = "daily_claim"
+    __table_args__ = (UniqueConstraint("clientId", "claimDate", name="UQ_daily_claim_client_date"),)
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    clientId = Column(String, nullable=False)
-    balanceOperationId = Column(String, nullable=False)
+    id = Column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4()))
+    clientId = Column(UUID(as_uuid=False), nullable=False)
+    claimDate = Column(Date, nullable=False)
+    balanceOperationId = Column(UUID(as_uuid=False), nullable=False)
     amount = Column(Integer, nullable=False)
     description = Column(Text, nullable=False)
     createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
     updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     def __repr__(self):
-        return (f"DailyClaim(id={self.id}, clientId={self.clientId}, "
+        return (f"DailyClaim(id={self.id}, clientId={self.clientId}, claimDate={self.claimDate}, "
                 f"balanceOperationId={self.balanceOperationId}, amount={self.amount}, "
                 f"description={self.description}, createdAt={self.createdAt}, "
                 f"updatedAt={self.updatedAt})")
@@ -0,0 +1,23 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Date, DateTime, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+
+Base = declarative_base()
+
+class DailyClaimStats(Base):
+    __tablename__ = "daily_claim_stats"
+    
+    clientId = Column(UUID(as_uuid=False), primary_key=True)
+    totalClaims = Column(Integer, default=0, nullable=False)
+    totalCoinsEarned = Column(Integer, default=0, nullable=False)
+    currentStreak = Column(Integer, default=0, nullable=False)  # consecutive days ending at lastClaimDate
+    bestStreak = Column(Integer, default=0, nullable=False)
+    lastClaimDate = Column(Date, nullable=True)
+    createdAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return (f"DailyClaimStats(clientId={self.clientId}, totalClaims={self.totalClaims}, "
+                f"totalCoinsEarned={self.totalCoinsEarned}, currentStreak={self.currentStreak}, "
+                f"bestStreak={self.bestStreak}, lastClaimDate={self.lastClaimDate})")
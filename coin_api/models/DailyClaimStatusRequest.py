@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+from typing import List
+
+class DailyClaimStatusRequest(BaseModel):
+    clientIds: List[str]
@@ -2,8 +2,16 @@ import { DataSource } from "typeorm";
 import { User } from "./src/entity/User";
 import { BalanceOperation } from "./src/entity/BalanceOperation";
 import { DailyClaim } from "./src/entity/DailyClaim";
+import { DailyClaimStats } from "./src/entity/DailyClaimStats";
 import { BetEvent } from "./src/entity/BetEvent";
+import { BetEventOption } from "./src/entity/BetEventOption";
 import { UserBet } from "./src/entity/UserBet";
+import { ClientBalance } from "./src/entity/ClientBalance";
+import { LedgerCheckpoint } from "./src/entity/LedgerCheckpoint";
+import { SettlementJob } from "./src/entity/SettlementJob";
+import { SettlementPayout } from "./src/entity/SettlementPayout";
+import { Airdrop } from "./src/entity/Airdrop";
+import { AirdropGrant } from "./src/entity/AirdropGrant";
 import * as dotenv from "dotenv";
 dotenv.config();
 
@@ -17,7 +25,7 @@ export default new DataSource({
     database: process.env.DB_NAME,
     synchronize: false,
     logging: false,
-    entities: [User, BalanceOperation, DailyClaim, BetEvent, UserBet],
+    entities: [User, BalanceOperation, DailyClaim, DailyClaimStats, BetEvent, BetEventOption, UserBet, ClientBalance, LedgerCheckpoint, SettlementJob, SettlementPayout, Airdrop, AirdropGrant],
     migrations: ["src/migration/**/*.ts"],
     subscribers: [],
 });
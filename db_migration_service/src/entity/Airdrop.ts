@@ -0,0 +1,34 @@
+import { Entity, PrimaryColumn, Column, CreateDateColumn, UpdateDateColumn } from "typeorm";
+
+@Entity({ name: "airdrop" })
+export class Airdrop {
+    @PrimaryColumn({ primaryKeyConstraintName: "PK_airdrop_id" })
+    id!: string;
+
+    @Column({ type: "integer" })
+    amount!: number;
+
+    @Column({ type: "text" })
+    description!: string;
+
+    @Column({ default: "running" })
+    status!: string;
+
+    @Column({ default: 0 })
+    recipients!: number;
+
+    @Column()
+    recipientsHash!: string;
+
+    @Column({ default: 0 })
+    granted!: number;
+
+    @Column({ type: "timestamp", nullable: true })
+    finishedAt?: Date;
+
+    @CreateDateColumn()
+    createdAt!: Date;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
@@ -0,0 +1,26 @@
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
+
+@Entity({ name: "airdrop_grant" })
+@Index("UQ_airdrop_grant_airdrop_client", ["airdropId", "clientId"], { unique: true })
+export class AirdropGrant {
+    @PrimaryGeneratedColumn("uuid", { primaryKeyConstraintName: "PK_airdrop_grant_id" })
+    id!: string;
+
+    @Column()
+    airdropId!: string;
+
+    @Column({ type: "uuid" })
+    clientId!: string;
+
+    @Column({ type: "integer" })
+    amount!: number;
+
+    @Column({ type: "uuid", nullable: true })
+    balanceOperationId?: string;
+
+    @CreateDateColumn()
+    createdAt!: Date;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
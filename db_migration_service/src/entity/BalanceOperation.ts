@@ -1,6 +1,7 @@
-import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn } from "typeorm";
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
 
 @Entity({ name: "balance_operation" })
+@Index("IDX_balance_operation_client_created", ["clientId", "createdAt", "id"])
 export class BalanceOperation {
     @PrimaryGeneratedColumn("uuid")
     id!: string;
@@ -14,6 +15,10 @@ export class BalanceOperation {
     @Column({ type: "text" })
     description!: string;
 
+    @Index("UQ_balance_operation_operationKey", { unique: true })
+    @Column({ type: "varchar", nullable: true })
+    operationKey?: string;
+
     @CreateDateColumn()
     createdAt!: Date;
 
@@ -1,6 +1,7 @@
-import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn } from "typeorm";
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
 
 @Entity({ name: "bet_event" })
+@Index("IDX_bet_event_finished_created", ["isFinished", "createdAt", "id"])
 export class BetEvent {
     @PrimaryGeneratedColumn()
     id!: number;
@@ -11,12 +12,6 @@ export class BetEvent {
     @Column({ nullable: true })
     description?: string;
 
-    @Column()
-    option1!: string;
-
-    @Column()
-    option2!: string;
-
     @Column({ default: true })
     isActive!: boolean;
 
@@ -29,12 +24,6 @@ export class BetEvent {
     @Column({ default: 0 })
     totalBetAmount!: number;
 
-    @Column({ default: 0 })
-    option1BetAmount!: number;
-
-    @Column({ default: 0 })
-    option2BetAmount!: number;
-    
     @CreateDateColumn()
     createdAt!: Date;
 
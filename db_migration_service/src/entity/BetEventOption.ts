@@ -0,0 +1,27 @@
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
+
+@Entity({ name: "bet_event_option" })
+@Index("UQ_bet_event_option_event_position", ["betEventId", "position"], { unique: true })
+export class BetEventOption {
+    @PrimaryGeneratedColumn({ primaryKeyConstraintName: "PK_bet_event_option_id" })
+    id!: number;
+
+    @Column()
+    betEventId!: number;
+
+    // 1-based; what user_bet.chosenOption and bet_event.winningOption refer to
+    @Column()
+    position!: number;
+
+    @Column()
+    label!: string;
+
+    @Column({ default: 0 })
+    betAmount!: number;
+
+    @CreateDateColumn()
+    createdAt!: Date;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
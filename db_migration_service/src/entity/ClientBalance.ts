@@ -0,0 +1,14 @@
+import { Entity, PrimaryColumn, Column, UpdateDateColumn, Index } from "typeorm";
+
+@Entity({ name: "client_balance" })
+export class ClientBalance {
+    @PrimaryColumn({ type: "uuid", primaryKeyConstraintName: "PK_client_balance_clientId" })
+    clientId!: string;
+
+    @Index("IDX_client_balance_balance")
+    @Column({ type: "integer", default: 0 })
+    balance!: number;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
@@ -1,6 +1,7 @@
-import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn } from "typeorm";
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
 
 @Entity({ name: "daily_claim" })
+@Index("UQ_daily_claim_client_date", ["clientId", "claimDate"], { unique: true })
 export class DailyClaim {
     @PrimaryGeneratedColumn("uuid")
     id!: string;
@@ -8,6 +9,9 @@ export class DailyClaim {
     @Column({ type: "uuid" })
     clientId!: string;
 
+    @Column({ type: "date" })
+    claimDate!: string;
+
     @Column({ type: "uuid" })
     balanceOperationId!: string;
 
@@ -0,0 +1,28 @@
+import { Entity, PrimaryColumn, Column, CreateDateColumn, UpdateDateColumn } from "typeorm";
+
+@Entity({ name: "daily_claim_stats" })
+export class DailyClaimStats {
+    @PrimaryColumn({ type: "uuid", primaryKeyConstraintName: "PK_daily_claim_stats_client" })
+    clientId!: string;
+
+    @Column({ default: 0 })
+    totalClaims!: number;
+
+    @Column({ default: 0 })
+    totalCoinsEarned!: number;
+
+    @Column({ default: 0 })
+    currentStreak!: number;
+
+    @Column({ default: 0 })
+    bestStreak!: number;
+
+    @Column({ type: "date", nullable: true })
+    lastClaimDate?: string;
+
+    @CreateDateColumn()
+    createdAt!: Date;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
@@ -0,0 +1,23 @@
+import { Entity, PrimaryColumn, Column, UpdateDateColumn, Index } from "typeorm";
+
+@Entity({ name: "ledger_checkpoint" })
+export class LedgerCheckpoint {
+    @PrimaryColumn({ type: "uuid", primaryKeyConstraintName: "PK_ledger_checkpoint_clientId" })
+    clientId!: string;
+
+    @Index("UQ_ledger_checkpoint_balanceOperationId", { unique: true })
+    @Column({ type: "uuid" })
+    balanceOperationId!: string;
+
+    @Column({ type: "integer", default: 0 })
+    amount!: number;
+
+    @Column({ type: "integer", default: 0 })
+    archivedRows!: number;
+
+    @Column({ type: "timestamp" })
+    cutoff!: Date;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
@@ -0,0 +1,26 @@
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
+
+@Entity({ name: "settlement_job" })
+export class SettlementJob {
+    @PrimaryGeneratedColumn({ primaryKeyConstraintName: "PK_settlement_job_id" })
+    id!: number;
+
+    @Index("UQ_settlement_job_betEventId", { unique: true })
+    @Column()
+    betEventId!: number;
+
+    @Column({ default: "running" })
+    status!: string;
+
+    @Column({ default: 0 })
+    totalAmount!: number;
+
+    @Column({ type: "timestamp", nullable: true })
+    finishedAt?: Date;
+
+    @CreateDateColumn()
+    createdAt!: Date;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
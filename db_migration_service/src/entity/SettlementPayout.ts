@@ -0,0 +1,46 @@
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
+
+@Entity({ name: "settlement_payout" })
+@Index("IDX_settlement_payout_job_status", ["jobId", "status"])
+@Index("IDX_settlement_payout_status_next", ["status", "nextAttemptAt"])
+export class SettlementPayout {
+    @PrimaryGeneratedColumn({ primaryKeyConstraintName: "PK_settlement_payout_id" })
+    id!: number;
+
+    @Column()
+    jobId!: number;
+
+    @Index("UQ_settlement_payout_betId", { unique: true })
+    @Column()
+    betId!: number;
+
+    @Column()
+    userId!: string;
+
+    @Column()
+    amount!: number;
+
+    @Column()
+    description!: string;
+
+    @Column()
+    operationKey!: string;
+
+    @Column({ default: "pending" })
+    status!: string;
+
+    @Column({ default: 0 })
+    attempts!: number;
+
+    @Column({ type: "timestamp", default: () => "now()" })
+    nextAttemptAt!: Date;
+
+    @Column({ nullable: true })
+    lastError?: string;
+
+    @CreateDateColumn()
+    createdAt!: Date;
+
+    @UpdateDateColumn()
+    updatedAt!: Date;
+}
@@ -1,6 +1,9 @@
-import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn } from "typeorm";
+import { Entity, PrimaryGeneratedColumn, Column, CreateDateColumn, UpdateDateColumn, Index } from "typeorm";
 
 @Entity({ name: "user_bet" })
+@Index("IDX_user_bet_user_id", ["userId", "id"])
+@Index("IDX_user_bet_event_option", ["betEventId", "chosenOption"])
+@Index("UQ_user_bet_user_event", ["userId", "betEventId"], { unique: true })
 export class UserBet {
     @PrimaryGeneratedColumn()
     id!: number;
@@ -0,0 +1,15 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddClientBalance1792310400000 implements MigrationInterface {
+    name = 'AddClientBalance1792310400000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE TABLE "client_balance" ("clientId" uuid NOT NULL, "balance" integer NOT NULL DEFAULT '0', "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_client_balance_clientId" PRIMARY KEY ("clientId"))`);
+        await queryRunner.query(`INSERT INTO "client_balance" ("clientId", "balance") SELECT "clientId", SUM("amount") FROM "balance_operation" GROUP BY "clientId"`);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP TABLE "client_balance"`);
+    }
+
+}
@@ -0,0 +1,14 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddClientBalanceRankIndex1792396800000 implements MigrationInterface {
+    name = 'AddClientBalanceRankIndex1792396800000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE INDEX "IDX_client_balance_balance" ON "client_balance" ("balance") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."IDX_client_balance_balance"`);
+    }
+
+}
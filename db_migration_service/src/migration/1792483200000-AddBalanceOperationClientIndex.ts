@@ -0,0 +1,14 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddBalanceOperationClientIndex1792483200000 implements MigrationInterface {
+    name = 'AddBalanceOperationClientIndex1792483200000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE INDEX "IDX_balance_operation_client_created" ON "balance_operation" ("clientId", "createdAt", "id") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."IDX_balance_operation_client_created"`);
+    }
+
+}
@@ -0,0 +1,16 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddLedgerCheckpoint1792569600000 implements MigrationInterface {
+    name = 'AddLedgerCheckpoint1792569600000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE TABLE "ledger_checkpoint" ("clientId" uuid NOT NULL, "balanceOperationId" uuid NOT NULL, "amount" integer NOT NULL DEFAULT '0', "archivedRows" integer NOT NULL DEFAULT '0', "cutoff" TIMESTAMP NOT NULL, "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_ledger_checkpoint_clientId" PRIMARY KEY ("clientId"))`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_ledger_checkpoint_balanceOperationId" ON "ledger_checkpoint" ("balanceOperationId") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."UQ_ledger_checkpoint_balanceOperationId"`);
+        await queryRunner.query(`DROP TABLE "ledger_checkpoint"`);
+    }
+
+}
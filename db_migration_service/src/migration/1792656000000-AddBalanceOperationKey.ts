@@ -0,0 +1,16 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddBalanceOperationKey1792656000000 implements MigrationInterface {
+    name = 'AddBalanceOperationKey1792656000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`ALTER TABLE "balance_operation" ADD "operationKey" character varying`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_balance_operation_operationKey" ON "balance_operation" ("operationKey") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."UQ_balance_operation_operationKey"`);
+        await queryRunner.query(`ALTER TABLE "balance_operation" DROP COLUMN "operationKey"`);
+    }
+
+}
@@ -0,0 +1,24 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddSettlementJobs1792742400000 implements MigrationInterface {
+    name = 'AddSettlementJobs1792742400000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE TABLE "settlement_job" ("id" SERIAL NOT NULL, "betEventId" integer NOT NULL, "status" character varying NOT NULL DEFAULT 'running', "totalAmount" integer NOT NULL DEFAULT '0', "finishedAt" TIMESTAMP, "createdAt" TIMESTAMP NOT NULL DEFAULT now(), "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_settlement_job_id" PRIMARY KEY ("id"))`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_settlement_job_betEventId" ON "settlement_job" ("betEventId") `);
+        await queryRunner.query(`CREATE TABLE "settlement_payout" ("id" SERIAL NOT NULL, "jobId" integer NOT NULL, "betId" integer NOT NULL, "userId" character varying NOT NULL, "amount" integer NOT NULL, "description" character varying NOT NULL, "operationKey" character varying NOT NULL, "status" character varying NOT NULL DEFAULT 'pending', "attempts" integer NOT NULL DEFAULT '0', "nextAttemptAt" TIMESTAMP NOT NULL DEFAULT now(), "lastError" character varying, "createdAt" TIMESTAMP NOT NULL DEFAULT now(), "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_settlement_payout_id" PRIMARY KEY ("id"))`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_settlement_payout_betId" ON "settlement_payout" ("betId") `);
+        await queryRunner.query(`CREATE INDEX "IDX_settlement_payout_job_status" ON "settlement_payout" ("jobId", "status") `);
+        await queryRunner.query(`CREATE INDEX "IDX_settlement_payout_status_next" ON "settlement_payout" ("status", "nextAttemptAt") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."IDX_settlement_payout_status_next"`);
+        await queryRunner.query(`DROP INDEX "public"."IDX_settlement_payout_job_status"`);
+        await queryRunner.query(`DROP INDEX "public"."UQ_settlement_payout_betId"`);
+        await queryRunner.query(`DROP TABLE "settlement_payout"`);
+        await queryRunner.query(`DROP INDEX "public"."UQ_settlement_job_betEventId"`);
+        await queryRunner.query(`DROP TABLE "settlement_job"`);
+    }
+
+}
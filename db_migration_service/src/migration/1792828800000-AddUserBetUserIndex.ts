@@ -0,0 +1,14 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddUserBetUserIndex1792828800000 implements MigrationInterface {
+    name = 'AddUserBetUserIndex1792828800000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE INDEX "IDX_user_bet_user_id" ON "user_bet" ("userId", "id") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."IDX_user_bet_user_id"`);
+    }
+
+}
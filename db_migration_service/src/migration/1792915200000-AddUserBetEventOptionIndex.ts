@@ -0,0 +1,14 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddUserBetEventOptionIndex1792915200000 implements MigrationInterface {
+    name = 'AddUserBetEventOptionIndex1792915200000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE INDEX "IDX_user_bet_event_option" ON "user_bet" ("betEventId", "chosenOption") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."IDX_user_bet_event_option"`);
+    }
+
+}
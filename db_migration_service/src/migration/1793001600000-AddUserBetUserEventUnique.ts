@@ -0,0 +1,23 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddUserBetUserEventUnique1793001600000 implements MigrationInterface {
+    name = 'AddUserBetUserEventUnique1793001600000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        // The old check-then-insert in place_bet could record a user twice on one event
+        const conflicts = await queryRunner.query(`SELECT "userId", "betEventId" FROM "user_bet" GROUP BY "userId", "betEventId" HAVING COUNT(DISTINCT "chosenOption") > 1`);
+        if (conflicts.length > 0) {
+            const pairs = conflicts.slice(0, 10).map((c: { userId: string, betEventId: number }) => `(${c.userId}, ${c.betEventId})`).join(", ");
+            throw new Error(`user_bet has ${conflicts.length} user/event pairs with bets on different options, e.g. ${pairs}. Refund or remove one side of each before running this migration.`);
+        }
+        // Same-option duplicates were all debited, so fold them into the earliest row with the summed amount
+        await queryRunner.query(`UPDATE "user_bet" u SET "amount" = d."total" FROM (SELECT MIN("id") AS "id", SUM("amount") AS "total" FROM "user_bet" GROUP BY "userId", "betEventId" HAVING COUNT(*) > 1) d WHERE u."id" = d."id"`);
+        await queryRunner.query(`DELETE FROM "user_bet" d USING "user_bet" k WHERE d."userId" = k."userId" AND d."betEventId" = k."betEventId" AND d."id" > k."id"`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_user_bet_user_event" ON "user_bet" ("userId", "betEventId") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."UQ_user_bet_user_event"`);
+    }
+
+}
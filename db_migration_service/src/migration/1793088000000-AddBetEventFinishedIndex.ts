@@ -0,0 +1,14 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddBetEventFinishedIndex1793088000000 implements MigrationInterface {
+    name = 'AddBetEventFinishedIndex1793088000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE INDEX "IDX_bet_event_finished_created" ON "bet_event" ("isFinished", "createdAt", "id") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."IDX_bet_event_finished_created"`);
+    }
+
+}
@@ -0,0 +1,31 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddBetEventOptions1793174400000 implements MigrationInterface {
+    name = 'AddBetEventOptions1793174400000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE TABLE "bet_event_option" ("id" SERIAL NOT NULL, "betEventId" integer NOT NULL, "position" integer NOT NULL, "label" character varying NOT NULL, "betAmount" integer NOT NULL DEFAULT '0', "createdAt" TIMESTAMP NOT NULL DEFAULT now(), "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_bet_event_option_id" PRIMARY KEY ("id"))`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_bet_event_option_event_position" ON "bet_event_option" ("betEventId", "position") `);
+        await queryRunner.query(`INSERT INTO "bet_event_option" ("betEventId", "position", "label", "betAmount", "createdAt") SELECT "id", 1, "option1", "option1BetAmount", "createdAt" FROM "bet_event"`);
+        await queryRunner.query(`INSERT INTO "bet_event_option" ("betEventId", "position", "label", "betAmount", "createdAt") SELECT "id", 2, "option2", "option2BetAmount", "createdAt" FROM "bet_event"`);
+        await queryRunner.query(`ALTER TABLE "bet_event" DROP COLUMN "option1"`);
+        await queryRunner.query(`ALTER TABLE "bet_event" DROP COLUMN "option2"`);
+        await queryRunner.query(`ALTER TABLE "bet_event" DROP COLUMN "option1BetAmount"`);
+        await queryRunner.query(`ALTER TABLE "bet_event" DROP COLUMN "option2BetAmount"`);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        // Only the first two options fit the old columns; events with more lose the rest
+        await queryRunner.query(`ALTER TABLE "bet_event" ADD "option1" character varying`);
+        await queryRunner.query(`ALTER TABLE "bet_event" ADD "option2" character varying`);
+        await queryRunner.query(`ALTER TABLE "bet_event" ADD "option1BetAmount" integer NOT NULL DEFAULT '0'`);
+        await queryRunner.query(`ALTER TABLE "bet_event" ADD "option2BetAmount" integer NOT NULL DEFAULT '0'`);
+        await queryRunner.query(`UPDATE "bet_event" SET "option1" = o."label", "option1BetAmount" = o."betAmount" FROM "bet_event_option" o WHERE o."betEventId" = "bet_event"."id" AND o."position" = 1`);
+        await queryRunner.query(`UPDATE "bet_event" SET "option2" = o."label", "option2BetAmount" = o."betAmount" FROM "bet_event_option" o WHERE o."betEventId" = "bet_event"."id" AND o."position" = 2`);
+        await queryRunner.query(`ALTER TABLE "bet_event" ALTER COLUMN "option1" SET NOT NULL`);
+        await queryRunner.query(`ALTER TABLE "bet_event" ALTER COLUMN "option2" SET NOT NULL`);
+        await queryRunner.query(`DROP INDEX "public"."UQ_bet_event_option_event_position"`);
+        await queryRunner.query(`DROP TABLE "bet_event_option"`);
+    }
+
+}
@@ -0,0 +1,20 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddDailyClaimDate1793260800000 implements MigrationInterface {
+    name = 'AddDailyClaimDate1793260800000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`ALTER TABLE "daily_claim" ADD "claimDate" date`);
+        await queryRunner.query(`UPDATE "daily_claim" SET "claimDate" = "createdAt"::date`);
+        // Racing claims could record a day twice; keep the first row (the ledger still has every credit)
+        await queryRunner.query(`DELETE FROM "daily_claim" d USING "daily_claim" e WHERE d."clientId" = e."clientId" AND d."claimDate" = e."claimDate" AND (d."createdAt", d."id") > (e."createdAt", e."id")`);
+        await queryRunner.query(`ALTER TABLE "daily_claim" ALTER COLUMN "claimDate" SET NOT NULL`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_daily_claim_client_date" ON "daily_claim" ("clientId", "claimDate") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."UQ_daily_claim_client_date"`);
+        await queryRunner.query(`ALTER TABLE "daily_claim" DROP COLUMN "claimDate"`);
+    }
+
+}
@@ -0,0 +1,18 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddAirdrops1793347200000 implements MigrationInterface {
+    name = 'AddAirdrops1793347200000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE TABLE "airdrop" ("id" character varying NOT NULL, "amount" integer NOT NULL, "description" text NOT NULL, "status" character varying NOT NULL DEFAULT 'running', "recipients" integer NOT NULL DEFAULT '0', "recipientsHash" character varying NOT NULL, "granted" integer NOT NULL DEFAULT '0', "finishedAt" TIMESTAMP, "createdAt" TIMESTAMP NOT NULL DEFAULT now(), "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_airdrop_id" PRIMARY KEY ("id"))`);
+        await queryRunner.query(`CREATE TABLE "airdrop_grant" ("id" uuid NOT NULL DEFAULT uuid_generate_v4(), "airdropId" character varying NOT NULL, "clientId" uuid NOT NULL, "amount" integer NOT NULL, "balanceOperationId" uuid, "createdAt" TIMESTAMP NOT NULL DEFAULT now(), "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_airdrop_grant_id" PRIMARY KEY ("id"))`);
+        await queryRunner.query(`CREATE UNIQUE INDEX "UQ_airdrop_grant_airdrop_client" ON "airdrop_grant" ("airdropId", "clientId") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX "public"."UQ_airdrop_grant_airdrop_client"`);
+        await queryRunner.query(`DROP TABLE "airdrop_grant"`);
+        await queryRunner.query(`DROP TABLE "airdrop"`);
+    }
+
+}
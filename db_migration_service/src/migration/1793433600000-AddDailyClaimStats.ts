@@ -0,0 +1,31 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddDailyClaimStats1793433600000 implements MigrationInterface {
+    name = 'AddDailyClaimStats1793433600000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`CREATE TABLE "daily_claim_stats" ("clientId" uuid NOT NULL, "totalClaims" integer NOT NULL DEFAULT '0', "totalCoinsEarned" integer NOT NULL DEFAULT '0', "currentStreak" integer NOT NULL DEFAULT '0', "bestStreak" integer NOT NULL DEFAULT '0', "lastClaimDate" date, "createdAt" TIMESTAMP NOT NULL DEFAULT now(), "updatedAt" TIMESTAMP NOT NULL DEFAULT now(), CONSTRAINT "PK_daily_claim_stats_client" PRIMARY KEY ("clientId"))`);
+        // Days in a streak share claimDate minus their row number, so each group is one streak
+        await queryRunner.query(`
+            WITH "runs" AS (
+                SELECT "clientId", "claimDate", "amount",
+                       "claimDate" - (ROW_NUMBER() OVER (PARTITION BY "clientId" ORDER BY "claimDate"))::int AS "streakStart"
+                FROM "daily_claim"
+            ), "streaks" AS (
+                SELECT "clientId", COUNT(*)::int AS "length", MAX("claimDate") AS "endDate"
+                FROM "runs" GROUP BY "clientId", "streakStart"
+            )
+            INSERT INTO "daily_claim_stats" ("clientId", "totalClaims", "totalCoinsEarned", "currentStreak", "bestStreak", "lastClaimDate")
+            SELECT c."clientId", COUNT(*), SUM(c."amount"),
+                   (SELECT s."length" FROM "streaks" s WHERE s."clientId" = c."clientId" ORDER BY s."endDate" DESC LIMIT 1),
+                   (SELECT MAX(s."length") FROM "streaks" s WHERE s."clientId" = c."clientId"),
+                   MAX(c."claimDate")
+            FROM "runs" c GROUP BY c."clientId"
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP TABLE "daily_claim_stats"`);
+    }
+
+}